@@ -1,6 +1,7 @@
 """Common utilities shared between PyHC actions."""
 
 from pyhc_actions.common.parser import (
+    clear_pyproject_cache,
     parse_pyproject,
     parse_requirements_txt,
     parse_dependency,
@@ -9,6 +10,7 @@ from pyhc_actions.common.parser import (
 from pyhc_actions.common.reporter import Reporter, Violation, Warning
 
 __all__ = [
+    "clear_pyproject_cache",
     "parse_pyproject",
     "parse_requirements_txt",
     "parse_dependency",
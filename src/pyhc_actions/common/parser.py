@@ -2,14 +2,18 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
 import re
-from dataclasses import dataclass
+import tomllib
+from dataclasses import dataclass, field
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from packaging.specifiers import SpecifierSet, InvalidSpecifier
 from packaging.version import Version, InvalidVersion
-import tomlkit
 
 if TYPE_CHECKING:
     from typing import Tuple
@@ -21,6 +25,16 @@ PEP_DEPENDENCY_RE = re.compile(
     r"^([A-Za-z0-9][A-Za-z0-9._-]*)(\[[A-Za-z0-9._,\s-]+\])?\s*([^;@]*)?(@.+)?(;.*)?$"
 )
 
+# Separators that normalize to "-"
+_NORMALIZE_TABLE = str.maketrans({"_": "-", ".": "-"})
+
+
+# Parsed pyproject.toml files: path -> (content digest, data)
+_PYPROJECT_CACHE: dict[str, tuple[bytes, dict]] = {}
+
+# Parsed [project] tables, cached the same way
+_PROJECT_SECTION_CACHE: dict[str, tuple[bytes, dict]] = {}
+
 
 @dataclass
 class VersionBounds:
@@ -44,6 +58,16 @@ class VersionBounds:
         """Returns True if there's an upper bound or exact version constraint."""
         return self.upper is not None or self.exact is not None
 
+    @cached_property
+    def lower_release(self) -> tuple[int, int, int] | None:
+        """Release tuple of the lower bound (see release_tuple)."""
+        return release_tuple(self.lower) if self.lower is not None else None
+
+    @cached_property
+    def upper_release(self) -> tuple[int, int, int] | None:
+        """Release tuple of the upper bound (see release_tuple)."""
+        return release_tuple(self.upper) if self.upper is not None else None
+
 
 @dataclass
 class ParsedDependency:
@@ -55,6 +79,14 @@ class ParsedDependency:
     markers: str | None = None
     is_url: bool = False
     raw: str = ""
+    name_lower: str = field(init=False, repr=False, compare=False)
+    pep503_name: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Computed once here since every check looks the name up
+        self.name_lower = self.name.lower()
+        # PEP 503 form, as produced by normalize_package_name
+        self.pep503_name = self.name_lower.translate(_NORMALIZE_TABLE)
 
     @property
     def normalized_name(self) -> str:
@@ -62,9 +94,56 @@ class ParsedDependency:
         return self.name.lower().replace("-", "_").replace(".", "_")
 
 
+def normalize_package_name(name: str) -> str:
+    """Normalize a package name for comparison.
+
+    PEP 503: Names should be lowercased with runs of underscores,
+    hyphens, and periods replaced with a single hyphen.
+
+    Args:
+        name: Package name to normalize
+
+    Returns:
+        Normalized package name
+    """
+    # Already-normalized names are the common case
+    if name.islower() and "_" not in name and "." not in name:
+        return name
+    return name.lower().translate(_NORMALIZE_TABLE)
+
+
+def release_tuple(version: Version) -> tuple[int, int, int] | None:
+    """Return (major, minor, micro) for a plain final release.
+
+    These tuples order plain releases exactly as Version does, but compare
+    much faster. Versions with pre/post/dev segments, local labels, an epoch
+    or more than three release parts return None, and callers should compare
+    the Version objects instead.
+
+    Args:
+        version: Parsed version
+
+    Returns:
+        Release tuple, or None if the version isn't a plain release
+    """
+    if (
+        version.pre is None
+        and version.post is None
+        and version.dev is None
+        and version.local is None
+        and version.epoch == 0
+        and len(version.release) <= 3
+    ):
+        return (version.major, version.minor, version.micro)
+    return None
+
+
 def parse_pyproject(path: Path | str) -> dict:
     """Parse a pyproject.toml file and return its contents.
 
+    The parse is cached per path and reused while the file's contents are
+    unchanged; each call returns its own copy of the data.
+
     Args:
         path: Path to the pyproject.toml file
 
@@ -73,11 +152,59 @@ def parse_pyproject(path: Path | str) -> dict:
 
     Raises:
         FileNotFoundError: If the file doesn't exist
-        tomlkit.exceptions.ParseError: If the file is invalid TOML
+        tomllib.TOMLDecodeError: If the file is invalid TOML
+    """
+    return _load_cached(_PYPROJECT_CACHE, Path(path), _load_toml)
+
+
+def parse_pyproject_project_section(path: Path | str) -> dict:
+    """Parse a pyproject.toml file and return only its [project] table.
+
+    The rest of the document (typically large [tool.*] tables) is discarded
+    right after parsing, so it is not kept alive by the cache.
+
+    Args:
+        path: Path to the pyproject.toml file
+
+    Returns:
+        Dictionary with the [project] table, empty if there is none
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        tomllib.TOMLDecodeError: If the file is invalid TOML
     """
-    path = Path(path)
-    with open(path) as f:
-        return tomlkit.load(f)
+
+    def load(raw: bytes) -> dict:
+        return _load_toml(raw).get("project", {})
+
+    return _load_cached(_PROJECT_SECTION_CACHE, Path(path), load)
+
+
+def clear_pyproject_cache() -> None:
+    """Drop all cached pyproject.toml parse results."""
+    _PYPROJECT_CACHE.clear()
+    _PROJECT_SECTION_CACHE.clear()
+
+
+def _load_toml(raw: bytes) -> dict:
+    """Parse a TOML document from the bytes of a file."""
+    return tomllib.loads(raw.decode())
+
+
+def _load_cached(cache: dict, path: Path, load) -> dict:
+    """Return a copy of load(file bytes), reusing the parse while they are unchanged.
+
+    The cache is keyed on a digest of the contents rather than on stat data,
+    which can miss a rewrite within the filesystem's timestamp granularity.
+    """
+    raw = path.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    key = str(path)
+
+    cached = cache.get(key)
+    if cached is None or cached[0] != digest:
+        cached = cache[key] = (digest, load(raw))
+    return copy.deepcopy(cached[1])
 
 
 def parse_requirements_txt(path: Path | str) -> list[ParsedDependency]:
@@ -114,9 +241,13 @@ def parse_requirements_txt(path: Path | str) -> list[ParsedDependency]:
     return dependencies
 
 
+@functools.lru_cache(maxsize=4096)
 def parse_dependency(dep_str: str) -> ParsedDependency | None:
     """Parse a PEP 508 dependency string.
 
+    Results are memoized by the raw string, so callers must treat the
+    returned object as read-only.
+
     Args:
         dep_str: Dependency string like "numpy>=1.20,<2.0" or "requests[security]>=2.25"
 
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable
 
 import requests
 import yaml
@@ -27,6 +27,26 @@ PYHC_ENVIRONMENT_YML_URL = (
     "main/docker/pyhc-environment/contents/environment.yml"
 )
 
+# Package-spec lines that uv can't take: comments, pip options (-r, -e, etc.),
+# and editable/path installs
+_SKIP_LINE_PREFIXES = ("#", "-", ".", "/")
+
+# Python version in an environment.yml dependency entry
+# Matches: python=3.12.9, python=3.12, python>=3.12, python==3.12.9
+# Also handles channel prefix: conda-forge::python=3.12.9=build_string
+_PYTHON_DEP_PATTERN = r"(?:\S*::)?python[<>=!]*=?(\d+\.\d+(?:\.\d+)?)"
+_PYTHON_DEP_VERSION_RE = re.compile(_PYTHON_DEP_PATTERN)
+
+# The top-level "dependencies:" block of environment.yml: every following
+# line that is blank, indented, or a "- ..." item
+_ENV_YML_DEPENDENCIES_RE = re.compile(
+    r"^dependencies:[ \t]*(?:#.*)?\n((?:[ \t-].*\n?|\n)*)", re.MULTILINE
+)
+
+# An unquoted "- ..." item of that block; group 1 is its indentation
+_ENV_YML_ITEM_RE = re.compile(r"^([ \t]*)-[ \t]", re.MULTILINE)
+_ENV_YML_PYTHON_ITEM_RE = re.compile(r"^([ \t]*)-[ \t]+" + _PYTHON_DEP_PATTERN, re.MULTILINE)
+
 
 def fetch_pyhc_packages(url: str | None = None) -> str:
     """Fetch PyHC Environment packages.txt content.
@@ -81,22 +101,10 @@ def parse_package_specs_for_uv(raw_text: str) -> list[str]:
     """
     package_specs = []
 
-    for line in raw_text.split("\n"):
+    for line in raw_text.splitlines():
         line = line.strip()
-
-        # Skip empty lines and comments
-        if not line or line.startswith("#"):
-            continue
-
-        # Skip pip options (-r, -e, etc.)
-        if line.startswith("-"):
-            continue
-
-        # Skip editable installs and path installs
-        if line.startswith(".") or line.startswith("/"):
-            continue
-
-        package_specs.append(line)
+        if line and not line.startswith(_SKIP_LINE_PREFIXES):
+            package_specs.append(line)
 
     return package_specs
 
@@ -202,6 +210,13 @@ def parse_python_version_from_env_yml(yaml_content: str) -> str | None:
     Returns:
         Python version string (e.g., "3.12.9" or "3.12") or None if not found
     """
+    # Fast path: a plain "- python=..." item of the dependencies list, found
+    # without a YAML parse
+    version = _python_version_from_env_yml_text(yaml_content)
+    if version is not None:
+        return version
+
+    # Quoted or otherwise unusual entries: parse the YAML properly
     try:
         data = yaml.safe_load(yaml_content)
     except yaml.YAMLError:
@@ -214,19 +229,52 @@ def parse_python_version_from_env_yml(yaml_content: str) -> str | None:
     if not isinstance(dependencies, list):
         return None
 
-    # Regex to extract version from various formats
-    # Matches: python=3.12.9, python=3.12, python>=3.12, python==3.12.9
-    # Also handles channel prefix: conda-forge::python=3.12.9=build_string
-    python_version_re = re.compile(
-        r"(?:.*::)?python[<>=!]*=?(\d+\.\d+(?:\.\d+)?)"
-    )
+    return _python_version_from_dep_strings(dependencies)
+
 
+def _python_version_from_env_yml_text(yaml_content: str) -> str | None:
+    """Find an unquoted Python item of the top-level dependencies list.
+
+    Only items at the list's own indentation count, so entries nested under
+    another key (such as ``pip:``) are ignored.
+
+    Args:
+        yaml_content: Raw YAML content of environment.yml
+
+    Returns:
+        Python version string, or None if no plain entry was found
+    """
+    block = _ENV_YML_DEPENDENCIES_RE.search(yaml_content)
+    if not block:
+        return None
+
+    first_item = _ENV_YML_ITEM_RE.search(block.group(1))
+    if not first_item:
+        return None
+
+    for match in _ENV_YML_PYTHON_ITEM_RE.finditer(block.group(1)):
+        if match.group(1) == first_item.group(1):
+            return match.group(2)
+    return None
+
+
+def _python_version_from_dep_strings(dependencies: Iterable[object]) -> str | None:
+    """Return the Python version pinned in a conda dependencies list.
+
+    Non-string entries (such as a nested ``pip:`` mapping) are skipped.
+
+    Args:
+        dependencies: Entries of the environment.yml ``dependencies`` list
+
+    Returns:
+        Python version string (e.g., "3.12.9" or "3.12") or None if not found
+    """
     for dep in dependencies:
         if not isinstance(dep, str):
             continue
 
         if dep.startswith("python") or "::python" in dep:
-            match = python_version_re.match(dep)
+            match = _PYTHON_DEP_VERSION_RE.match(dep)
             if match:
                 return match.group(1)
 
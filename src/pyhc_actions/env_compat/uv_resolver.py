@@ -2,13 +2,21 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
+import os
 import re
 import shutil
+import string
 import subprocess
+import sys
 import tempfile
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
+from typing import Iterator, Mapping
 
 from packaging.requirements import InvalidRequirement, Requirement
 from packaging.specifiers import SpecifierSet, InvalidSpecifier
@@ -17,18 +25,172 @@ from packaging.version import Version, InvalidVersion
 
 from pyhc_actions.common.reporter import Reporter
 from pyhc_actions.common.parser import parse_pyproject
+from pyhc_actions.env_compat import version_fast
 from pyhc_actions.env_compat.fetcher import (
     load_pyhc_packages,
     load_pyhc_constraints,
     get_package_from_pyproject,
     get_pyhc_python_version,
 )
+from pyhc_actions.phep3 import metadata_extractor
+
+
+# Fallback conflict extraction: "depends on numpy<2" or "requires numpy>=2.0"
+# Note: [<>=!~]+ handles multi-char operators like >=, <=, !=, ==, ~=
+_PKG_VERSION_RE = re.compile(
+    r"(?:depends\s+on|requires?)\s+([a-zA-Z0-9_-]+)(\[[^\]]+\])?([<>=!~]+[0-9][^\s,]*)",
+    re.IGNORECASE,
+)
+
+# Build-definition files that make a directory a candidate for uv metadata
+# extraction (a lock file alone does not make a project buildable)
+_PACKAGING_FILES = frozenset({"setup.py", "setup.cfg", "pyproject.toml"})
+
+# uv-extracted metadata: (project dir, packaging-file digest) -> metadata
+_UV_METADATA_CACHE: dict[tuple[str, bytes], metadata_extractor.PackageMetadata] = {}
+_UV_METADATA_CACHE_SIZE = 128
+
+# Bounded stderr capture for uv lock: keep the last 64 chunks of 1 KB
+_STDERR_TAIL_CHUNK_SIZE = 1024
+_STDERR_TAIL_CHUNKS = 64
+
+# TOML basic-string escapes: backslash, quote, and every control character
+_TOML_ESCAPES = str.maketrans(
+    {
+        **{chr(c): f"\\u{c:04X}" for c in (*range(0x20), 0x7F)},
+        "\b": "\\b",
+        "\t": "\\t",
+        "\n": "\\n",
+        "\f": "\\f",
+        "\r": "\\r",
+        '"': '\\"',
+        "\\": "\\\\",
+    }
+)
+
+# Single-character uv tree glyphs blanked out of error summaries
+_TREE_CHARS_TRANS = str.maketrans({"│": " ", "├": " "})
+
+# Unpublished-package indicators, scanned in one pass over lowercased stderr;
+# group 1 is the package name that follows the indicator (if any)
+_UNPUBLISHED_RE = re.compile(
+    r"(?:no\s+version\s+of|could\s+not\s+find\s+a\s+version\s+that\s+satisfies)"
+    r"(?:\s+([a-z0-9_.-]+))?"
+)
+
+# Building blocks for the parse_uv_error conflict patterns. Package names can
+# include hyphens/underscores; extras like [image] are supported. The version
+# spec handles <, >, =, !, ~ (e.g. >=1.0, <2.0, ~=1.20, >=1.0,<2.0) and captures
+# comma-separated constraints while avoiding trailing commas.
+_UV_PKG_NAME = r"[a-zA-Z0-9_-]+"
+_UV_EXTRAS = r"(?:\[[^\]]+\])?"
+_UV_VERSION_SPEC = r"[<>=!~]=?[^\\s,]+(?:,[<>=!~][^\\s,]+)*"
+_UV_REQ = rf"({_UV_PKG_NAME})({_UV_EXTRAS}{_UV_VERSION_SPEC})"
+
+# "Because X requires pkg-spec and Y requires pkg-spec"
+_BOTH_REQUIRE_RE = re.compile(
+    rf"Because\s+(\S+)\s+requires\s+{_UV_REQ},?\s+and\s+(\S+)\s+requires\s+{_UV_REQ},?\s",
+    re.IGNORECASE,
+)
+
+# "X depends on pkg-spec and Y depends on pkg-spec"
+_BOTH_DEPENDS_RE = re.compile(
+    rf"(\S+)\s+depends\s+on\s+{_UV_REQ},?\s+and\s+(\S+)\s+depends\s+on\s+{_UV_REQ},?\s",
+    re.IGNORECASE,
+)
+
+# "X depends on pkg-spec and you require pkg-spec" (uv's format when checking
+# a local package against requirements)
+_DEPENDS_YOU_REQUIRE_RE = re.compile(
+    rf"(\S+)\s+depends\s+on\s+{_UV_REQ},?\s+and\s+(you)\s+require\s+{_UV_REQ},?\s",
+    re.IGNORECASE,
+)
+
+# "you require pkg-spec and X depends on pkg-spec"
+_YOU_REQUIRE_DEPENDS_RE = re.compile(
+    rf"(you)\s+require\s+{_UV_REQ},?\s+and\s+(\S+)\s+depends\s+on\s+{_UV_REQ},?\s",
+    re.IGNORECASE,
+)
+
+# Patterns whose groups are (source1, pkg1, spec1, source2, pkg2, spec2)
+_PAIRED_CONFLICT_RES = (
+    _BOTH_REQUIRE_RE,
+    _BOTH_DEPENDS_RE,
+    _DEPENDS_YOU_REQUIRE_RE,
+    _YOU_REQUIRE_DEPENDS_RE,
+)
+
+# "only X<Y is available and Z depends on X[extra]>=Y"
+_ONLY_AVAILABLE_DEPENDS_RE = re.compile(
+    rf"only\s+{_UV_REQ}\s+is\s+available\s+and\s+(\S+)\s+depends\s+on\s+{_UV_REQ}",
+    re.IGNORECASE,
+)
+
+# "only X<Y is available and you require X>=Y"
+_ONLY_AVAILABLE_YOU_RE = re.compile(
+    rf"only\s+{_UV_REQ}\s+is\s+available\s+and\s+(you)\s+require\s+{_UV_REQ}",
+    re.IGNORECASE,
+)
+
+# "there is no version of X==Y and you require X==Y"
+_NO_VERSION_YOU_REQUIRE_RE = re.compile(
+    rf"no\s+version\s+of\s+{_UV_REQ}\s+and\s+you\s+require\s+{_UV_REQ}",
+    re.IGNORECASE,
+)
+
+# Explicit "X and Y are incompatible" with package names
+_ARE_INCOMPATIBLE_RE = re.compile(
+    rf"({_UV_PKG_NAME})({_UV_EXTRAS}[<>=!~]+[0-9][0-9.]*)\s+.*?\s+"
+    rf"({_UV_PKG_NAME})({_UV_EXTRAS}[<>=!~]+[0-9][0-9.]*)\s+are\s+incompatible",
+    re.IGNORECASE,
+)
+
+# Missing-from-registry messages, each with a lowercase keyword that must
+# appear in stderr for the pattern to be worth a scan; group 1 is the
+# package name
+_MISSING_REGISTRY_PACKAGE_RES = tuple(
+    (keyword, re.compile(pattern, re.IGNORECASE))
+    for keyword, pattern in (
+        (
+            "registry",
+            r"\b([A-Za-z0-9_.-]+)\s+was\s+not\s+found\s+in\s+the\s+package\s+registry",
+        ),
+        (
+            "version",
+            r"Because\s+there\s+is\s+no\s+version\s+of\s+([A-Za-z0-9_.-]+)(?:\s|[<>=!~]|,)",
+        ),
+        (
+            "satisfies",
+            r"Could\s+not\s+find\s+a\s+version\s+that\s+satisfies\s+the\s+requirement\s+([A-Za-z0-9_.-]+)",
+        ),
+    )
+)
+
+# Characters of a package name in uv pip compile output, and the characters
+# that can start the version spec after it
+_PKG_NAME_CHARS = string.ascii_letters + string.digits + "_.-"
+_SPEC_OPERATOR_CHARS = frozenset("<>=!~")
+
+# "current Python version (X.Y.Z) does not satisfy Python>=X.Y", matched
+# against lowercased stderr
+_PYTHON_VERSION_ERROR_RE = re.compile(
+    r"current python version \([\d.]+\) does not satisfy python([<>=!]+[\d.]+)"
+)
 
 
 def _normalize_spec(spec: str) -> str:
     """Normalize version specifier by trimming whitespace and trailing punctuation."""
-    spec = spec.strip()
-    return spec.rstrip(".,;")
+    return spec.strip().rstrip(".,;")
+
+
+def _spec_name_prefix(spec: str) -> str:
+    """Return the part of a "name<op>version" spec before its first operator."""
+    end = len(spec)
+    for op_char in "<>=!~":
+        index = spec.find(op_char, 0, end)
+        if index != -1:
+            end = index
+    return spec[:end]
 
 
 def _canonicalize_package_name(name: str | None) -> str | None:
@@ -82,6 +244,59 @@ def _find_requirement_for_package(
     return None
 
 
+def _packaging_files_digest(project_dir: Path) -> bytes | None:
+    """Hash the files uv can extract metadata from.
+
+    Checked before spawning uv so directories it would fail on are skipped.
+
+    Returns:
+        Digest of the packaging files' names and contents, or None if the
+        directory has none (or they cannot be read)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    found = False
+    try:
+        for name in sorted(_PACKAGING_FILES):
+            path = project_dir / name
+            if not path.is_file():
+                continue
+            found = True
+            digest.update(name.encode())
+            digest.update(path.read_bytes())
+    except OSError:
+        return None
+    return digest.digest() if found else None
+
+
+def _extract_uv_metadata(
+    project_dir: str,
+) -> metadata_extractor.PackageMetadata | None:
+    """Extract legacy project metadata with uv, once per project state.
+
+    The base check and every extras check ask for the same project, so the
+    uv venv/install round-trip is only paid on the first call. Results are
+    keyed on the packaging files' contents, so an edited project is
+    extracted again, and failures are not cached.
+    """
+    project_path = Path(project_dir)
+    digest = _packaging_files_digest(project_path)
+    if digest is None:
+        return None
+
+    key = (project_dir, digest)
+    metadata = _UV_METADATA_CACHE.get(key)
+    if metadata is not None:
+        return metadata
+
+    metadata = metadata_extractor.extract_metadata_with_uv(project_path)
+    if metadata is not None:
+        if len(_UV_METADATA_CACHE) >= _UV_METADATA_CACHE_SIZE:
+            # Evict the oldest entry
+            del _UV_METADATA_CACHE[next(iter(_UV_METADATA_CACHE))]
+        _UV_METADATA_CACHE[key] = metadata
+    return metadata
+
+
 def _python_version_for_uv(pyhc_python: str | None) -> str | None:
     """Convert Python version to uv-compatible major.minor form."""
     if not pyhc_python:
@@ -122,15 +337,16 @@ def parse_resolved_versions(uv_output: str) -> dict[str, str]:
         # - Version specs: "numpy==2.1.3" or "scipy>=1.13.0,<2.0"
         # - Editable/local installs: "pyspedas @ file:///path/to/package"
         # - Git installs: "package @ git+https://..."
-        # Package names can contain letters, numbers, hyphens, underscores, and dots
-        match = re.match(r'^([a-zA-Z0-9_.-]+)\s*(@\s+.+|[<>=!~].*)$', line)
-        if match:
-            pkg_name, spec = match.groups()
+        rest = line.lstrip(_PKG_NAME_CHARS)
+        pkg_name = line[: len(line) - len(rest)]
+        if not pkg_name:
+            continue
+        spec = rest.lstrip()
+        if spec[:1] in _SPEC_OPERATOR_CHARS:
+            resolved[pkg_name] = f"{pkg_name}{spec}"
+        elif spec[:1] == "@" and spec[1:2].isspace():
             # Add space before @ for proper formatting
-            if spec.startswith('@'):
-                resolved[pkg_name] = f"{pkg_name} {spec}"
-            else:
-                resolved[pkg_name] = f"{pkg_name}{spec}"
+            resolved[pkg_name] = f"{pkg_name} {spec}"
     return resolved
 
 
@@ -141,7 +357,7 @@ class ConflictOrigin(str, Enum):
     PYHC_ENVIRONMENT = "pyhc-environment"
 
 
-@dataclass
+@dataclass(slots=True)
 class Conflict:
     """Represents a dependency conflict."""
 
@@ -152,6 +368,7 @@ class Conflict:
     origin: ConflictOrigin = ConflictOrigin.PACKAGE
 
 
+@functools.lru_cache(maxsize=4096)
 def check_python_compatibility(
     requires_python: str | None,
     pyhc_python: str,
@@ -159,7 +376,8 @@ def check_python_compatibility(
     """Check if package's requires-python is compatible with PyHC Environment.
 
     This is an upfront check to catch Python version incompatibilities before
-    running uv resolution, providing a clearer error message.
+    running uv resolution, providing a clearer error message. Results are
+    cached per (requires_python, pyhc_python) pair.
 
     Args:
         requires_python: The requires-python string from pyproject.toml (e.g., ">=3.11,<3.14")
@@ -175,20 +393,28 @@ def check_python_compatibility(
     if not requires_python:
         return True, None
 
-    try:
-        specifier = SpecifierSet(requires_python)
-    except InvalidSpecifier:
-        # If we can't parse the specifier, skip this check and let uv handle it
-        return True, None
+    # Common case: plain release numbers, compared as integer tuples
+    clauses = version_fast.parse_specifier(requires_python)
+    release = version_fast.parse_release(pyhc_python)
+    if clauses is not None and release is not None:
+        compatible = version_fast.contains_fast(clauses, release)
+    else:
+        try:
+            specifier = SpecifierSet(requires_python)
+        except InvalidSpecifier:
+            # If we can't parse the specifier, skip this check and let uv handle it
+            return True, None
 
-    try:
-        pyhc_version = Version(pyhc_python)
-    except InvalidVersion:
-        # If we can't parse the PyHC version, skip this check
-        return True, None
+        try:
+            pyhc_version = Version(pyhc_python)
+        except InvalidVersion:
+            # If we can't parse the PyHC version, skip this check
+            return True, None
+
+        compatible = pyhc_version in specifier
 
     # Check if PyHC's Python version satisfies the package's requirements
-    if pyhc_version in specifier:
+    if compatible:
         return True, None
 
     # PyHC's Python version is incompatible
@@ -200,9 +426,12 @@ def check_python_compatibility(
     return False, error_msg
 
 
+@functools.lru_cache(maxsize=1)
 def find_uv() -> str | None:
     """Find the uv executable.
 
+    The result is cached for the life of the process.
+
     Returns:
         Path to uv executable or None if not found
     """
@@ -306,14 +535,18 @@ def check_compatibility(
                 context=context,
             )
 
-    # Upfront Python version compatibility check
-    # This catches Python incompatibilities with a clear error message
-    # before running the full uv resolution
+    # Read the [project] table once; later steps reuse it instead of re-parsing
     try:
-        pyproject_data = parse_pyproject(pyproject_path)
-        requires_python = pyproject_data.get("project", {}).get("requires-python")
+        project_table = parse_pyproject(pyproject_path).get("project", {})
+        requires_python = project_table.get("requires-python")
+        pyproject_name = project_table.get("name")
     except Exception:
         requires_python = None
+        pyproject_name = None
+
+    # Upfront Python version compatibility check
+    # This catches Python incompatibilities with a clear error message
+    # before running the full uv resolution
 
     if pyhc_python is None:
         pyhc_python = get_pyhc_python_version()
@@ -374,19 +607,13 @@ def check_compatibility(
 
     # Get package name to filter from PyHC packages
     # (avoid conflict with package checking itself)
-    package_name = None
-    try:
-        pyproject_data = parse_pyproject(pyproject_path)
-        package_name = pyproject_data.get("project", {}).get("name")
-    except Exception:
-        pass
+    package_name = pyproject_name
 
     # For setup.py packages, try extracting name using uv
     if not package_name:
         try:
-            from pyhc_actions.phep3.metadata_extractor import extract_metadata_with_uv
             project_dir = pyproject_path if pyproject_path.is_dir() else pyproject_path.parent
-            metadata = extract_metadata_with_uv(project_dir)
+            metadata = _extract_uv_metadata(str(project_dir.resolve()))
             if metadata:
                 package_name = metadata.name
         except Exception:
@@ -464,8 +691,11 @@ def check_compatibility(
 
             return True, []
 
+        # Lowercase once; the error classifiers below all match case-insensitively.
+        stderr_lower = result.stderr.lower()
+
         # Preserve non-conflict handling before running the baseline diagnosis.
-        if _is_platform_specific_error(result.stderr):
+        if _is_platform_specific_error(result.stderr, stderr_lower):
             reporter.add_warning(
                 package="platform",
                 message="Platform-specific packages in PyHC Environment",
@@ -475,7 +705,9 @@ def check_compatibility(
             )
             return True, []
 
-        is_python_error, required_version = _is_python_version_error(result.stderr)
+        is_python_error, required_version = _is_python_version_error(
+            result.stderr, stderr_lower
+        )
         if is_python_error:
             reporter.add_warning(
                 package="python",
@@ -578,14 +810,10 @@ def check_compatibility(
                 ]
 
         # Check if error is due to package resolution issues (not on PyPI, no wheels, build issues)
-        # Extract package name from pyproject.toml
-        try:
-            pyproject_data = parse_pyproject(pyproject_path)
-            package_name = pyproject_data.get("project", {}).get("name")
-        except Exception:
-            package_name = None
+        # Use the package name from pyproject.toml
+        package_name = pyproject_name
 
-        if _is_unpublished_package_error(result.stderr, package_name):
+        if _is_unpublished_package_error(result.stderr, package_name, stderr_lower):
             _report_error(
                 package=package_name or "package",
                 message="Unable to resolve package version",
@@ -634,7 +862,7 @@ def check_compatibility(
             ]
 
         # Parse conflicts from error output
-        conflicts = parse_uv_error(result.stderr, package_name)
+        conflicts = parse_uv_error(result.stderr, package_name, stderr_lower)
 
         for conflict in conflicts:
             # Generate suggestion based on PyHC requirement
@@ -681,11 +909,13 @@ def check_compatibility(
             Path(temp_constraints).unlink(missing_ok=True)
 
 
-def _is_platform_specific_error(stderr: str) -> bool:
+def _is_platform_specific_error(stderr: str, stderr_lower: str | None = None) -> bool:
     """Check if the error is due to platform-specific packages.
 
     These are not real conflicts - they occur when packages like
     nvidia-nccl-cu12 are only available for Linux.
+
+    ``stderr_lower`` may be passed to reuse an already-lowercased copy.
     """
     platform_indicators = [
         "no wheels with a matching platform tag",
@@ -696,11 +926,14 @@ def _is_platform_specific_error(stderr: str) -> bool:
         "nvidia-nccl",
         "nvidia-cuda",
     ]
-    stderr_lower = stderr.lower()
+    if stderr_lower is None:
+        stderr_lower = stderr.lower()
     return any(indicator in stderr_lower for indicator in platform_indicators)
 
 
-def _is_python_version_error(stderr: str) -> tuple[bool, str | None]:
+def _is_python_version_error(
+    stderr: str, stderr_lower: str | None = None
+) -> tuple[bool, str | None]:
     """Check if the error is due to Python version mismatch.
 
     This occurs when the Python version running the check doesn't satisfy
@@ -716,17 +949,18 @@ def _is_python_version_error(stderr: str) -> tuple[bool, str | None]:
     """
     # Look for "current Python version (X.Y.Z) does not satisfy Python>=X.Y"
     # or "current Python version (X.Y.Z) does not satisfy Python<X.Y"
-    match = re.search(
-        r"current python version \([\d.]+\) does not satisfy python([<>=!]+[\d.]+)",
-        stderr.lower(),
-    )
+    if stderr_lower is None:
+        stderr_lower = stderr.lower()
+    match = _PYTHON_VERSION_ERROR_RE.search(stderr_lower)
     if match:
         return True, f"Python{match.group(1)}"
 
     return False, None
 
 
-def parse_uv_error(stderr: str, package_name: str | None = None) -> list[Conflict]:
+def parse_uv_error(
+    stderr: str, package_name: str | None = None, stderr_lower: str | None = None
+) -> list[Conflict]:
     """Parse uv error output to extract conflict information.
 
     uv outputs messages in various formats:
@@ -743,6 +977,8 @@ def parse_uv_error(stderr: str, package_name: str | None = None) -> list[Conflic
 
     Args:
         stderr: Standard error output from uv
+        package_name: Name of the package under test, if known
+        stderr_lower: Already-lowercased stderr, to avoid lowercasing it again
 
     Returns:
         List of Conflict objects
@@ -752,11 +988,10 @@ def parse_uv_error(stderr: str, package_name: str | None = None) -> list[Conflic
 
     def _strip_extras(spec: str) -> str:
         """Normalize specifier by removing leading extras (e.g., [image])."""
-        spec = _normalize_spec(spec)
-        if spec.startswith("["):
-            end = spec.find("]")
-            if end != -1:
-                return spec[end + 1 :]
+        spec = spec.strip().rstrip(".,;")
+        if spec[:1] == "[":
+            end = spec.find("]", 1)
+            return spec[end + 1 :] if end != -1 else spec
         return spec
 
     def add_conflict(pkg1: str, spec1: str, pkg2: str, spec2: str, source1: str, source2: str) -> bool:
@@ -793,114 +1028,71 @@ def parse_uv_error(stderr: str, package_name: str | None = None) -> list[Conflic
                 return True
         return False
 
-    # Package + version patterns
-    # Package names can include hyphens/underscores; extras like [image] are supported.
-    PKG_NAME = r"[a-zA-Z0-9_-]+"
-    EXTRAS = r"(?:\[[^\]]+\])?"
-    # Version spec pattern: handles <, >, =, !, ~ (for ~= compatible release)
-    # Examples: >=1.0, <2.0, ==1.5, !=1.3, ~=1.20, >=1.0,<2.0
-    # Capture comma-separated constraints but avoid trailing commas.
-    VERSION_SPEC = r"[<>=!~]=?[^\\s,]+(?:,[<>=!~][^\\s,]+)*"
-
-    # Pattern 1: "Because X requires pkg-spec and Y requires pkg-spec" style
-    pattern1 = re.compile(
-        rf"Because\s+(\S+)\s+requires\s+({PKG_NAME})({EXTRAS}{VERSION_SPEC}),?\s+and\s+(\S+)\s+requires\s+({PKG_NAME})({EXTRAS}{VERSION_SPEC}),?\s",
-        re.IGNORECASE,
-    )
-
-    # Pattern 2: "X depends on pkg-spec and Y depends on pkg-spec" style
-    pattern2 = re.compile(
-        rf"(\S+)\s+depends\s+on\s+({PKG_NAME})({EXTRAS}{VERSION_SPEC}),?\s+and\s+(\S+)\s+depends\s+on\s+({PKG_NAME})({EXTRAS}{VERSION_SPEC}),?\s",
-        re.IGNORECASE,
-    )
-
-    # Pattern 3: "X depends on pkg-spec and you require pkg-spec" style
-    # This is the actual format uv uses when checking a local package against requirements
-    pattern3 = re.compile(
-        rf"(\S+)\s+depends\s+on\s+({PKG_NAME})({EXTRAS}{VERSION_SPEC}),?\s+and\s+(you)\s+require\s+({PKG_NAME})({EXTRAS}{VERSION_SPEC}),?\s",
-        re.IGNORECASE,
-    )
-
-    # Pattern 4: Reverse of pattern 3 - "you require pkg-spec and X depends on pkg-spec"
-    pattern4 = re.compile(
-        rf"(you)\s+require\s+({PKG_NAME})({EXTRAS}{VERSION_SPEC}),?\s+and\s+(\S+)\s+depends\s+on\s+({PKG_NAME})({EXTRAS}{VERSION_SPEC}),?\s",
-        re.IGNORECASE,
-    )
-
-    # Try all patterns
-    for pattern in [pattern1, pattern2, pattern3, pattern4]:
+    # Try all paired-requirement patterns
+    for pattern in _PAIRED_CONFLICT_RES:
         for match in pattern.finditer(stderr):
             source1, pkg1, spec1, source2, pkg2, spec2 = match.groups()
             add_conflict(pkg1, spec1, pkg2, spec2, source1, source2)
 
-    # Pattern 5: "only X<Y is available and Z depends on X[extra]>=Y"
-    pattern_available_depends = re.compile(
-        rf"only\s+({PKG_NAME})({EXTRAS}{VERSION_SPEC})\s+is\s+available\s+and\s+(\S+)\s+depends\s+on\s+({PKG_NAME})({EXTRAS}{VERSION_SPEC})",
-        re.IGNORECASE,
-    )
-    for match in pattern_available_depends.finditer(stderr):
-        avail_pkg, avail_spec, source, req_pkg, req_spec = match.groups()
-        # If the "available" package is the one being checked locally, treat it as "your requirement"
-        if package_name and avail_pkg.lower() == package_name.lower():
-            add_conflict(avail_pkg, avail_spec, req_pkg, req_spec, "available", source)
-        else:
-            # Default: dependency requirement is treated as "your requirement"
-            add_conflict(req_pkg, req_spec, avail_pkg, avail_spec, source, "available")
-
-    # Pattern 6: "only X<Y is available and you require X>=Y"
-    pattern_available_you = re.compile(
-        rf"only\s+({PKG_NAME})({EXTRAS}{VERSION_SPEC})\s+is\s+available\s+and\s+(you)\s+require\s+({PKG_NAME})({EXTRAS}{VERSION_SPEC})",
-        re.IGNORECASE,
-    )
-    for match in pattern_available_you.finditer(stderr):
-        avail_pkg, avail_spec, you_token, req_pkg, req_spec = match.groups()
-        # Ensure the "you" token is used to map your requirement to req_spec
-        add_conflict(req_pkg, req_spec, avail_pkg, avail_spec, "available", you_token)
-
-    # Pattern 7: "there is no version of X==Y and you require X==Y"
-    pattern_no_version = re.compile(
-        rf"no\s+version\s+of\s+({PKG_NAME})({EXTRAS}{VERSION_SPEC})\s+and\s+you\s+require\s+({PKG_NAME})({EXTRAS}{VERSION_SPEC})",
-        re.IGNORECASE,
-    )
-    for match in pattern_no_version.finditer(stderr):
-        pkg1, spec1, pkg2, spec2 = match.groups()
-        if pkg1.lower() == pkg2.lower() and pkg1.lower() not in seen_packages:
-            seen_packages.add(pkg1.lower())
-            conflicts.append(
-                Conflict(
-                    package=pkg1,
-                    your_requirement="(not specified)",
-                    pyhc_requirement=f"{pkg1}{spec1}",
-                    reason="No matching distribution found",
-                )
-            )
-
-    # Pattern 8: Look for explicit "X and Y are incompatible" with package names
-    pattern5 = re.compile(
-        rf"({PKG_NAME})({EXTRAS}[<>=!~]+[0-9][0-9.]*)\s+.*?\s+({PKG_NAME})({EXTRAS}[<>=!~]+[0-9][0-9.]*)\s+are\s+incompatible",
-        re.IGNORECASE,
-    )
-
-    for match in pattern5.finditer(stderr):
-        pkg1, spec1, pkg2, spec2 = match.groups()
-        if pkg1.lower() == pkg2.lower() and pkg1.lower() not in seen_packages:
-            spec1_clean = _normalize_spec(spec1)
-            spec2_clean = _normalize_spec(spec2)
-            if _strip_extras(spec1_clean) != _strip_extras(spec2_clean):
+    # The remaining shapes each hinge on one keyword; skip a full regex scan
+    # when stderr does not contain it at all
+    if stderr_lower is None:
+        stderr_lower = stderr.lower()
+
+    if "available" in stderr_lower:
+        # Pattern 5: "only X<Y is available and Z depends on X[extra]>=Y"
+        for match in _ONLY_AVAILABLE_DEPENDS_RE.finditer(stderr):
+            avail_pkg, avail_spec, source, req_pkg, req_spec = match.groups()
+            # If the "available" package is the one being checked locally, treat it as "your requirement"
+            if package_name and avail_pkg.lower() == package_name.lower():
+                add_conflict(avail_pkg, avail_spec, req_pkg, req_spec, "available", source)
+            else:
+                # Default: dependency requirement is treated as "your requirement"
+                add_conflict(req_pkg, req_spec, avail_pkg, avail_spec, source, "available")
+
+        # Pattern 6: "only X<Y is available and you require X>=Y"
+        for match in _ONLY_AVAILABLE_YOU_RE.finditer(stderr):
+            avail_pkg, avail_spec, you_token, req_pkg, req_spec = match.groups()
+            # Ensure the "you" token is used to map your requirement to req_spec
+            add_conflict(req_pkg, req_spec, avail_pkg, avail_spec, "available", you_token)
+
+    if "version" in stderr_lower:
+        # Pattern 7: "there is no version of X==Y and you require X==Y"
+        for match in _NO_VERSION_YOU_REQUIRE_RE.finditer(stderr):
+            pkg1, spec1, pkg2, spec2 = match.groups()
+            if pkg1.lower() == pkg2.lower() and pkg1.lower() not in seen_packages:
                 seen_packages.add(pkg1.lower())
                 conflicts.append(
                     Conflict(
                         package=pkg1,
-                        your_requirement=f"{pkg1}{spec1_clean}",
-                        pyhc_requirement=f"{pkg2}{spec2_clean}",
-                        reason="Version requirements are incompatible",
+                        your_requirement="(not specified)",
+                        pyhc_requirement=f"{pkg1}{spec1}",
+                        reason="No matching distribution found",
                     )
                 )
 
+    if "incompatible" in stderr_lower:
+        # Pattern 8: Look for explicit "X and Y are incompatible" with package names
+        for match in _ARE_INCOMPATIBLE_RE.finditer(stderr):
+            pkg1, spec1, pkg2, spec2 = match.groups()
+            if pkg1.lower() == pkg2.lower() and pkg1.lower() not in seen_packages:
+                spec1_clean = _normalize_spec(spec1)
+                spec2_clean = _normalize_spec(spec2)
+                if _strip_extras(spec1_clean) != _strip_extras(spec2_clean):
+                    seen_packages.add(pkg1.lower())
+                    conflicts.append(
+                        Conflict(
+                            package=pkg1,
+                            your_requirement=f"{pkg1}{spec1_clean}",
+                            pyhc_requirement=f"{pkg2}{spec2_clean}",
+                            reason="Version requirements are incompatible",
+                        )
+                    )
+
     # If still no conflicts found, try to extract package info from the error
     if not conflicts and "No solution found" in stderr:
         # Try to find any package with conflicting versions mentioned
-        conflict = _extract_conflict_from_error(stderr)
+        conflict = _extract_conflict_from_error(stderr, stderr_lower)
         if conflict:
             conflicts.append(conflict)
         else:
@@ -917,33 +1109,40 @@ def parse_uv_error(stderr: str, package_name: str | None = None) -> list[Conflic
     return conflicts
 
 
-def discover_optional_extras(pyproject_path: Path | str) -> list[str]:
+def discover_optional_extras(source: Path | str | Mapping) -> list[str]:
     """Discover optional dependency groups from a project.
 
     Attempts to read [project.optional-dependencies] from pyproject.toml.
     Falls back to uv-based metadata extraction for legacy formats.
+
+    Args:
+        source: Path to a pyproject.toml or project directory, or an
+            already-parsed pyproject mapping (which skips the filesystem
+            and the uv fallback entirely)
+
+    Returns:
+        Sorted list of optional dependency group names
     """
-    pyproject_path = Path(pyproject_path)
+    if isinstance(source, Mapping):
+        return _optional_extras_from_pyproject(source) or []
+
+    pyproject_path = Path(source)
     pyproject_file = pyproject_path
     if pyproject_path.is_dir():
         pyproject_file = pyproject_path / "pyproject.toml"
 
     if pyproject_file.exists():
         try:
-            pyproject_data = parse_pyproject(pyproject_file)
-            project = pyproject_data.get("project", {})
-            optional_deps = project.get("optional-dependencies", {})
-            if isinstance(optional_deps, dict):
-                return sorted(optional_deps.keys())
+            extras = _optional_extras_from_pyproject(parse_pyproject(pyproject_file))
+            if extras is not None:
+                return extras
         except Exception:
             pass
 
     # Fallback to uv-based metadata extraction (setup.py / Poetry)
     try:
-        from pyhc_actions.phep3.metadata_extractor import extract_metadata_with_uv
-
         project_dir = pyproject_path if pyproject_path.is_dir() else pyproject_path.parent
-        metadata = extract_metadata_with_uv(project_dir)
+        metadata = _extract_uv_metadata(str(project_dir.resolve()))
         if metadata and metadata.optional_dependencies:
             return sorted(metadata.optional_dependencies.keys())
     except Exception:
@@ -952,77 +1151,87 @@ def discover_optional_extras(pyproject_path: Path | str) -> list[str]:
     return []
 
 
-def _extract_conflict_from_error(stderr: str) -> Conflict | None:
+def _optional_extras_from_pyproject(pyproject_data: Mapping) -> list[str] | None:
+    """Return sorted [project.optional-dependencies] keys, or None if malformed."""
+    optional_deps = pyproject_data.get("project", {}).get("optional-dependencies", {})
+    if isinstance(optional_deps, dict):
+        return sorted(optional_deps.keys())
+    return None
+
+
+def _extract_conflict_from_error(
+    stderr: str, stderr_lower: str | None = None
+) -> Conflict | None:
     """Try to extract conflict info from error message when patterns don't match.
 
     This is a fallback that looks for package names and version specs mentioned
     in the error, even if they don't match our expected patterns.
+    ``stderr_lower`` may be passed to reuse an already-lowercased copy.
     """
-    # Look for patterns like "depends on numpy<2" or "requires numpy>=2.0"
-    # Note: [<>=!~]+ handles multi-char operators like >=, <=, !=, ==, ~=
-    pkg_version_pattern = re.compile(
-        r"(?:depends\s+on|requires?)\s+([a-zA-Z0-9_-]+)(\[[^\]]+\])?([<>=!~]+[0-9][^\s,]*)",
-        re.IGNORECASE,
-    )
+    # Cheap prematch: without either keyword the regex below cannot match
+    if stderr_lower is None:
+        stderr_lower = stderr.lower()
+    if "depends" not in stderr_lower and "require" not in stderr_lower:
+        return None
 
     def _strip_extras_from_spec(spec: str) -> str:
-        spec = _normalize_spec(spec)
-        if spec.startswith("["):
-            end = spec.find("]")
-            if end != -1:
-                return spec[end + 1 :]
+        spec = spec.strip().rstrip(".,;")
+        if spec[:1] == "[":
+            end = spec.find("]", 1)
+            return spec[end + 1 :] if end != -1 else spec
         return spec
 
-    matches = pkg_version_pattern.findall(stderr)
-    if len(matches) >= 2:
-        # Group by package name
-        by_package: dict[str, list[str]] = {}
-        by_package_norm: dict[str, set[str]] = {}
-        for pkg, extras, spec in matches:
-            extras = extras or ""
-            spec = _normalize_spec(spec)
-            full_spec = f"{pkg}{extras}{spec}"
-            pkg_lower = pkg.lower()
-            if pkg_lower not in by_package:
-                by_package[pkg_lower] = []
-                by_package_norm[pkg_lower] = set()
-            if full_spec not in by_package[pkg_lower]:
-                by_package[pkg_lower].append(full_spec)
-            by_package_norm[pkg_lower].add(_strip_extras_from_spec(f"{extras}{spec}"))
-
-        # Find a package with multiple different specs (conflict)
-        for pkg_lower, specs in by_package.items():
-            if len(by_package_norm.get(pkg_lower, set())) >= 2:
-                # Extract package name from the first spec (e.g., "requests" from "requests<2.0")
-                pkg_name = re.split(r"[<>=!]", specs[0])[0]
-                return Conflict(
-                    package=pkg_name,
-                    your_requirement=specs[0],
-                    pyhc_requirement=specs[1],
-                    reason="Conflicting version requirements detected",
-                )
+    # Group by package name
+    by_package: defaultdict[str, list[str]] = defaultdict(list)
+    by_package_norm: defaultdict[str, set[str]] = defaultdict(set)
+    seen_specs: defaultdict[str, set[str]] = defaultdict(set)
+    for match in _PKG_VERSION_RE.finditer(stderr):
+        pkg, extras, spec = match.group(1), match.group(2) or "", match.group(3)
+        spec = _normalize_spec(spec)
+        full_spec = f"{pkg}{extras}{spec}"
+        # Interned so repeated mentions of a package share one key object
+        pkg_lower = sys.intern(pkg.lower())
+        # Set membership keeps dedupe O(1); the list preserves report order
+        package_seen = seen_specs[pkg_lower]
+        if full_spec not in package_seen:
+            package_seen.add(full_spec)
+            by_package[pkg_lower].append(full_spec)
+        norm_specs = by_package_norm[pkg_lower]
+        norm_specs.add(_strip_extras_from_spec(f"{extras}{spec}"))
+
+        # Stop at the first package with multiple different specs (conflict)
+        if len(norm_specs) >= 2:
+            specs = by_package[pkg_lower]
+            # Extract package name from the first spec (e.g., "requests" from "requests<2.0")
+            pkg_name = _spec_name_prefix(specs[0])
+            return Conflict(
+                package=pkg_name,
+                your_requirement=specs[0],
+                pyhc_requirement=specs[1],
+                reason="Conflicting version requirements detected",
+            )
 
     return None
 
 
-def _is_unpublished_package_error(stderr: str, package_name: str | None = None) -> bool:
+def _is_unpublished_package_error(
+    stderr: str,
+    package_name: str | None = None,
+    stderr_lower: str | None = None,
+) -> bool:
     """Check if error is due to package not being published on PyPI.
 
     Args:
         stderr: Error output from uv
         package_name: Optional package name to check for
+        stderr_lower: Already-lowercased stderr, computed if not given
 
     Returns:
         True if this looks like an unpublished package error
     """
-    indicators = [
-        "no version of",
-        "because there is no version of",
-        "could not find a version that satisfies",
-    ]
-
-    stderr_lower = stderr.lower()
-    missing_package = _extract_missing_registry_package(stderr)
+    if stderr_lower is None:
+        stderr_lower = stderr.lower()
+    missing_package = _extract_missing_registry_package(stderr, stderr_lower)
     if missing_package:
         if package_name:
             return (
@@ -1032,29 +1241,36 @@ def _is_unpublished_package_error(stderr: str, package_name: str | None = None)
         return True
 
     # Check if any indicator matches
-    for indicator in indicators:
-        if indicator in stderr_lower:
-            # If package name provided, verify it's about that package
-            if package_name:
-                pattern = f"{indicator}\\s+{re.escape(package_name.lower())}"
-                if re.search(pattern, stderr_lower):
-                    return True
-            else:
-                return True
+    package_name_lower = package_name.lower() if package_name else None
+    for match in _UNPUBLISHED_RE.finditer(stderr_lower):
+        # If package name provided, verify it's about that package
+        if package_name_lower is None:
+            return True
+        subject = match.group(1)
+        if subject and subject.rstrip(",.") == package_name_lower:
+            return True
 
     return False
 
 
-def _extract_missing_registry_package(stderr: str) -> str | None:
-    """Extract the package name when uv reports a package is missing from a registry."""
-    patterns = [
-        r"\b([A-Za-z0-9_.-]+)\s+was\s+not\s+found\s+in\s+the\s+package\s+registry",
-        r"Because\s+there\s+is\s+no\s+version\s+of\s+([A-Za-z0-9_.-]+)(?:\s|[<>=!~]|,)",
-        r"Could\s+not\s+find\s+a\s+version\s+that\s+satisfies\s+the\s+requirement\s+([A-Za-z0-9_.-]+)",
-    ]
+def _extract_missing_registry_package(
+    stderr: str, stderr_lower: str | None = None
+) -> str | None:
+    """Extract the package name when uv reports a package is missing from a registry.
 
-    for pattern in patterns:
-        match = re.search(pattern, stderr, re.IGNORECASE)
+    Args:
+        stderr: Error output from uv
+        stderr_lower: Already-lowercased stderr, computed if not given
+
+    Returns:
+        The missing package name, or None if no such message is present
+    """
+    if stderr_lower is None:
+        stderr_lower = stderr.lower()
+    for keyword, pattern in _MISSING_REGISTRY_PACKAGE_RES:
+        if keyword not in stderr_lower:
+            continue
+        match = pattern.search(stderr)
         if match:
             return match.group(1)
 
@@ -1066,26 +1282,40 @@ def _extract_error_summary(stderr: str) -> str:
 
     Returns the error message without hints, formatted for display.
     """
-    lines = stderr.strip().split("\n")
-    summary_lines = []
+    # Return full error, not truncated
+    return "\n".join(_iter_summary_lines(stderr))
+
 
-    for line in lines:
+def _iter_summary_lines(stderr: str) -> Iterator[str]:
+    """Yield cleaned, non-hint lines of uv output."""
+    for line in stderr.splitlines():
         line = line.strip()
         # Skip empty lines and hints
-        if not line or line.lower().startswith("hint:"):
+        if not line or line[:5].lower() == "hint:":
             continue
         # Clean up uv's tree characters
-        line = line.replace("╰─▶", "→").replace("│", " ").replace("├", " ")
-        summary_lines.append(line)
+        yield line.replace("╰─▶", "→").translate(_TREE_CHARS_TRANS)
 
-    # Return full error, not truncated
-    return "\n".join(summary_lines)
+
+def _toml_basic_string(value: str) -> str:
+    """Format a string as a quoted TOML basic string.
+
+    Raises:
+        ValueError: If the string cannot be encoded as UTF-8 (lone surrogates)
+    """
+    try:
+        value.encode("utf-8")
+    except UnicodeEncodeError as e:
+        raise ValueError(f"{value!r} is not valid UTF-8 text") from e
+    return f'"{value.translate(_TOML_ESCAPES)}"'
 
 
 def run_uv_lock_check(
     pyproject_path: Path | str,
     pyhc_packages: list[str],
     reporter: Reporter | None = None,
+    workspace: Path | str | None = None,
+    uv_cache_dir: Path | str | None = None,
 ) -> tuple[bool, str]:
     """Alternative check using uv lock with a temporary project.
 
@@ -1098,6 +1328,11 @@ def run_uv_lock_check(
         pyproject_path: Path to the package's pyproject.toml
         pyhc_packages: List of PyHC package specs
         reporter: Optional reporter
+        workspace: Existing directory to write the temporary project into
+            (a fresh temporary directory is used if None). Files left there
+            by a previous run, including uv.lock, are removed first so every
+            call resolves from scratch.
+        uv_cache_dir: Shared uv cache directory so repeated calls resolve warm
 
     Returns:
         Tuple of (success, error_message)
@@ -1109,36 +1344,96 @@ def run_uv_lock_check(
     pyproject_path = Path(pyproject_path)
     package_path = get_package_from_pyproject(pyproject_path)
 
-    with tempfile.TemporaryDirectory() as tmpdir:
+    env = None
+    if uv_cache_dir is not None:
+        env = {**os.environ, "UV_CACHE_DIR": str(uv_cache_dir)}
+
+    workspace_context = (
+        contextlib.nullcontext(str(workspace))
+        if workspace is not None
+        else tempfile.TemporaryDirectory()
+    )
+    with workspace_context as tmpdir:
         tmpdir = Path(tmpdir)
 
+        # Stale pins in a reused workspace would bias the new resolution
+        for name in ("uv.lock", "pyproject.toml"):
+            (tmpdir / name).unlink(missing_ok=True)
+
         # Create temporary pyproject.toml
-        temp_pyproject = {
-            "project": {
-                "name": "pyhc-compat-check",
-                "version": "0.0.0",
-                "requires-python": ">=3.11",
-                "dependencies": [
-                    package_path,  # The package being checked
-                    *pyhc_packages,  # All PyHC packages
-                ],
-            }
-        }
-
-        import tomlkit
+        # The schema is fixed, so format it directly
+        dependencies = [
+            package_path,  # The package being checked
+            *pyhc_packages,  # All PyHC packages
+        ]
+        try:
+            dependency_lines = "".join(
+                f"    {_toml_basic_string(dep)},\n" for dep in dependencies
+            )
+        except ValueError as e:
+            return False, f"Invalid dependency: {e}"
         pyproject_file = tmpdir / "pyproject.toml"
-        with open(pyproject_file, "w") as f:
-            tomlkit.dump(temp_pyproject, f)
+        pyproject_file.write_text(
+            "[project]\n"
+            'name = "pyhc-compat-check"\n'
+            'version = "0.0.0"\n'
+            'requires-python = ">=3.11"\n'
+            f"dependencies = [\n{dependency_lines}]\n",
+            encoding="utf-8",
+        )
 
         # Run uv lock
-        result = subprocess.run(
+        returncode, stderr = _run_keeping_stderr_tail(
             [uv_path, "lock"],
-            capture_output=True,
-            text=True,
             cwd=tmpdir,
+            env=env,
         )
 
-        if result.returncode == 0:
+        if returncode == 0:
             return True, ""
 
-        return False, result.stderr
+        return False, stderr
+
+
+def _run_keeping_stderr_tail(
+    command: list[str],
+    cwd: Path,
+    env: dict[str, str] | None = None,
+) -> tuple[int, str]:
+    """Run a command, keeping only the last ~64 KB of its stderr.
+
+    Pathological resolver failures can emit megabytes of output; the useful
+    conflict explanation is at the end, so older chunks are dropped as they
+    stream in. Stdout is discarded and stdin is closed so uv never waits on a
+    terminal.
+
+    The kept chunks are joined and decoded in one go, so only the very start
+    of the tail can fall inside a multi-byte character; when earlier output
+    was dropped, that partial character is trimmed.
+
+    Returns:
+        Tuple of (return code, decoded stderr tail)
+    """
+    tail: deque[bytes] = deque(maxlen=_STDERR_TAIL_CHUNKS)
+    dropped = False
+    with subprocess.Popen(
+        command,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        cwd=cwd,
+        env=env,
+    ) as process:
+        for chunk in iter(lambda: process.stderr.read(_STDERR_TAIL_CHUNK_SIZE), b""):
+            dropped = dropped or len(tail) == tail.maxlen
+            tail.append(chunk)
+        returncode = process.wait()
+
+    data = b"".join(tail)
+    if dropped:
+        # Skip UTF-8 continuation bytes left over from a dropped chunk
+        start = 0
+        while start < len(data) and data[start] & 0xC0 == 0x80:
+            start += 1
+        data = data[start:]
+    return returncode, data.decode("utf-8", "replace")
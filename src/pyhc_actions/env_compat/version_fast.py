@@ -0,0 +1,121 @@
+"""Fast matching of release-only Python versions against version specifiers.
+
+Handles the PEP 440 subset that requires-python strings use in practice:
+plain release numbers (e.g. "3.12.9") with the ==, !=, <, <=, >, >= and ~=
+operators, comma-separated clauses, and ".*" prefix matches on == and !=.
+Anything outside that subset (epochs, pre/post/dev releases, local versions,
+===) is rejected so callers can fall back to packaging.
+"""
+
+from __future__ import annotations
+
+Release = tuple[int, ...]
+Clause = tuple[str, Release, bool]
+
+# Longest operators first so "<=" is not read as "<"
+_OPERATORS = ("~=", "==", "!=", "<=", ">=", "<", ">")
+
+
+def parse_release(version: str) -> Release | None:
+    """Parse a plain release version like "3.12.9" into an integer tuple.
+
+    Args:
+        version: Version string
+
+    Returns:
+        Tuple of release components, or None if the version is not a plain
+        dotted run of ASCII digits
+    """
+    parts = version.strip().split(".")
+    for part in parts:
+        if not (part.isascii() and part.isdigit()):
+            return None
+    return tuple(map(int, parts))
+
+
+def parse_specifier(specifier: str) -> list[Clause] | None:
+    """Parse a comma-separated specifier string into clauses.
+
+    Args:
+        specifier: Specifier string like ">=3.11,<3.14" or "==3.12.*"
+
+    Returns:
+        List of (operator, release, is_prefix_match) clauses, or None if any
+        clause is outside the supported subset
+    """
+    clauses: list[Clause] = []
+    for raw in specifier.split(","):
+        clause = raw.strip()
+        if not clause:
+            continue
+        if clause.startswith("==="):
+            return None
+        for op in _OPERATORS:
+            if clause.startswith(op):
+                break
+        else:
+            return None
+
+        version = clause[len(op) :].strip()
+        prefix = version.endswith(".*")
+        if prefix:
+            if op not in ("==", "!="):
+                return None
+            version = version[:-2]
+
+        release = parse_release(version)
+        if release is None or (op == "~=" and len(release) < 2):
+            return None
+        clauses.append((op, release, prefix))
+    return clauses
+
+
+def _compare(left: Release, right: Release) -> int:
+    """Compare releases as packaging does, padding the shorter with zeros."""
+    width = max(len(left), len(right))
+    left = left + (0,) * (width - len(left))
+    right = right + (0,) * (width - len(right))
+    return (left > right) - (left < right)
+
+
+def _prefix_matches(release: Release, prefix: Release) -> bool:
+    """Return True if release starts with prefix (after zero padding)."""
+    padded = release + (0,) * (len(prefix) - len(release))
+    return padded[: len(prefix)] == prefix
+
+
+def contains_fast(clauses: list[Clause], release: Release) -> bool:
+    """Check whether a final release satisfies every clause.
+
+    Args:
+        clauses: Clauses from parse_specifier
+        release: Release tuple from parse_release
+
+    Returns:
+        True if release satisfies all clauses (an empty list matches anything)
+    """
+    for op, spec, prefix in clauses:
+        if prefix:
+            matched = _prefix_matches(release, spec)
+            if matched != (op == "=="):
+                return False
+            continue
+
+        cmp = _compare(release, spec)
+        if op == "==":
+            ok = cmp == 0
+        elif op == "!=":
+            ok = cmp != 0
+        elif op == "<":
+            ok = cmp < 0
+        elif op == "<=":
+            ok = cmp <= 0
+        elif op == ">":
+            ok = cmp > 0
+        elif op == ">=":
+            ok = cmp >= 0
+        else:  # ~=
+            ok = cmp >= 0 and _prefix_matches(release, spec[:-1])
+        if not ok:
+            return False
+    return True
@@ -1,6 +1,5 @@
 """PHEP 3 compliance checker."""
 
-from pyhc_actions.phep3.checker import check_compliance
 from pyhc_actions.phep3.config import CORE_PACKAGES, PYTHON_SUPPORT_MONTHS, PACKAGE_SUPPORT_MONTHS, ADOPTION_MONTHS
 
 __all__ = [
@@ -10,3 +9,12 @@ __all__ = [
     "PACKAGE_SUPPORT_MONTHS",
     "ADOPTION_MONTHS",
 ]
+
+
+def __getattr__(name: str):
+    # Import the checker on first use so the CLI can start without it
+    if name == "check_compliance":
+        from pyhc_actions.phep3.checker import check_compliance
+
+        return check_compliance
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
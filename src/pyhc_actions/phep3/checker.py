@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
+import json
+import operator
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
+from typing import TextIO
 
-from packaging.markers import Marker, InvalidMarker, default_environment
+from packaging.markers import Marker, InvalidMarker
 from packaging.specifiers import SpecifierSet, InvalidSpecifier
 from packaging.version import Version
 
@@ -16,17 +23,30 @@ from pyhc_actions.common.parser import (
     extract_python_version,
     extract_python_bounds,
     parse_dependency,
-    parse_pyproject,
+    parse_pyproject_project_section,
+    release_tuple,
 )
 from pyhc_actions.common.reporter import Reporter
 from pyhc_actions.phep3.config import (
     CORE_PACKAGES,
+    CORE_PACKAGES_NORMALIZED,
     PACKAGE_SUPPORT_MONTHS,
     PYTHON_SUPPORT_MONTHS,
-    is_core_package,
-    normalize_package_name,
+    fast_package_name,
 )
-from pyhc_actions.phep3.schedule import Schedule
+from pyhc_actions.phep3.schedule import Schedule, VersionSchedule
+
+# Specifier operators that are a plain comparison against a final release
+_INTERVAL_OPERATORS = {
+    ">=": operator.ge,
+    ">": operator.gt,
+    "<=": operator.le,
+    "<": operator.lt,
+}
+
+# Loaded schedule files: path -> (content digest, schedule)
+_SCHEDULE_CACHE: dict[str, tuple[bytes, Schedule]] = {}
+_SCHEDULE_CACHE_LOCK = threading.Lock()
 
 
 def check_compliance(
@@ -37,6 +57,7 @@ def check_compliance(
     now: datetime | None = None,
     use_uv_fallback: bool = True,
     ignore_errors_for: set[str] | None = None,
+    use_metadata_cache: bool = False,
 ) -> bool:
     """Check pyproject.toml compliance with PHEP 3.
 
@@ -48,6 +69,7 @@ def check_compliance(
         now: Current time (for testing)
         use_uv_fallback: Whether to use uv for projects with non-PEP 621 metadata
         ignore_errors_for: Set of package names (lowercase) to treat errors as warnings
+        use_metadata_cache: Whether uv metadata extraction may use the on-disk cache
 
     Returns:
         True if compliant (no errors), False otherwise
@@ -64,14 +86,16 @@ def check_compliance(
 
     # Try parsing pyproject.toml first
     try:
-        pyproject_data = parse_pyproject(pyproject_path)
-        project = pyproject_data.get("project", {})
+        project = parse_pyproject_project_section(pyproject_path)
 
         if project:
             # PEP 621 format
             requires_python = project.get("requires-python")
-            # Extract base dependencies
+            # Extract base dependencies (only core packages are checked,
+            # so skip parsing anything else)
             for dep_str in project.get("dependencies", []):
+                if fast_package_name(dep_str) not in CORE_PACKAGES_NORMALIZED:
+                    continue
                 dep = parse_dependency(dep_str)
                 if dep:
                     base_dependencies.append(dep)
@@ -79,6 +103,8 @@ def check_compliance(
             for group_name, group_deps in project.get("optional-dependencies", {}).items():
                 extras_dependencies[group_name] = []
                 for dep_str in group_deps:
+                    if fast_package_name(dep_str) not in CORE_PACKAGES_NORMALIZED:
+                        continue
                     dep = parse_dependency(dep_str)
                     if dep:
                         extras_dependencies[group_name].append(dep)
@@ -88,7 +114,6 @@ def check_compliance(
             reporter.print("Note: 'pyproject.toml' not found; attempting uv metadata extraction.")
         else:
             reporter.print("Note: 'pyproject.toml' not found.")
-        pyproject_data = None
         project = {}
     except Exception as e:
         reporter.add_warning(
@@ -97,7 +122,6 @@ def check_compliance(
             details="Will attempt uv-based extraction if available",
             suggestion="Consider using pyproject.toml",
         )
-        pyproject_data = None
         project = {}
 
     # Try uv fallback if needed
@@ -105,23 +129,27 @@ def check_compliance(
         from pyhc_actions.phep3.metadata_extractor import extract_metadata_from_project
 
         project_dir = pyproject_path.parent if pyproject_path.suffix == ".toml" else pyproject_path
-        metadata = extract_metadata_from_project(project_dir, schedule)
+        metadata = extract_metadata_from_project(
+            project_dir, schedule, use_cache=use_metadata_cache
+        )
 
         if metadata:
             requires_python = metadata.requires_python
             # Extract base dependencies
             base_dependencies = [
-                parse_dependency(dep)
+                parsed
                 for dep in metadata.dependencies
-                if parse_dependency(dep) is not None
+                if fast_package_name(dep) in CORE_PACKAGES_NORMALIZED
+                and (parsed := parse_dependency(dep)) is not None
             ]
             # Extract optional dependencies by group
             for group_name, group_deps in metadata.optional_dependencies.items():
-                extras_dependencies[group_name] = []
-                for dep_str in group_deps:
-                    dep = parse_dependency(dep_str)
-                    if dep:
-                        extras_dependencies[group_name].append(dep)
+                extras_dependencies[group_name] = [
+                    parsed
+                    for dep_str in group_deps
+                    if fast_package_name(dep_str) in CORE_PACKAGES_NORMALIZED
+                    and (parsed := parse_dependency(dep_str)) is not None
+                ]
             if metadata.extracted_via and metadata.extracted_via != "uv":
                 extraction_method = f"uv (from {metadata.extracted_via})"
                 reporter.print(
@@ -140,8 +168,11 @@ def check_compliance(
         )
         return False
 
+    # Versions that must be supported are fixed for this (schedule, now) pair
+    required_pythons = _required_python_versions(schedule, now)
+
     # Check Python version requirement
-    _check_python_version(requires_python, schedule, reporter, now)
+    _check_python_version(requires_python, schedule, reporter, now, required_pythons)
 
     supported_python_versions = _get_supported_python_versions(
         requires_python, schedule, now
@@ -149,8 +180,31 @@ def check_compliance(
 
     # Check base dependencies (violations are errors, unless in ignore_errors_for)
     ignore_set = ignore_errors_for or set()
-    for dep in base_dependencies:
-        should_warn = dep.name.lower() in ignore_set
+    tasks: list[tuple[ParsedDependency, str, bool]] = [
+        (dep, "base", dep.name_lower in ignore_set) for dep in base_dependencies
+    ]
+
+    # Check extras dependencies (violations are warnings). The same requirement
+    # listed in several groups is checked once and reported for all of them.
+    extras_by_raw: dict[str, tuple[ParsedDependency, list[str]]] = {}
+    for group_name, deps in extras_dependencies.items():
+        for dep in deps:
+            entry = extras_by_raw.get(dep.raw)
+            if entry is None:
+                extras_by_raw[dep.raw] = (dep, [group_name])
+            elif group_name not in entry[1]:
+                entry[1].append(group_name)
+
+    tasks.extend(
+        (dep, ", ".join(group_names), True)
+        for dep, group_names in extras_by_raw.values()
+    )
+
+    # Versions of each package that must be supported at now, shared by every
+    # dependency on that package during this check
+    required_by_package: dict[str, list[tuple[str, Version]]] = {}
+
+    for dep, context, report_as_warning in tasks:
         _check_dependency(
             dep,
             schedule,
@@ -158,24 +212,11 @@ def check_compliance(
             check_adoption,
             now,
             supported_python_versions,
-            context="base",
-            report_as_warning=should_warn,
+            context=context,
+            report_as_warning=report_as_warning,
+            required_by_package=required_by_package,
         )
 
-    # Check extras dependencies (violations are warnings)
-    for group_name, deps in extras_dependencies.items():
-        for dep in deps:
-            _check_dependency(
-                dep,
-                schedule,
-                reporter,
-                check_adoption,
-                now,
-                supported_python_versions,
-                context=group_name,
-                report_as_warning=True,
-            )
-
     return not reporter.has_errors
 
 
@@ -184,8 +225,12 @@ def _check_python_version(
     schedule: Schedule,
     reporter: Reporter,
     now: datetime,
+    required_pythons: list[tuple[str, Version]] | None = None,
 ):
     """Check Python version requirement compliance."""
+    if required_pythons is None:
+        required_pythons = _required_python_versions(schedule, now)
+
     if not requires_python:
         reporter.add_warning(
             package="python",
@@ -216,9 +261,14 @@ def _check_python_version(
     min_required = schedule.get_minimum_python_version(now)
 
     if min_required:
-        min_required_ver = Version(min_required)
+        min_required_ver = schedule.parsed_version(min_required)
         # ERROR if lower bound is higher than minimum required (drops support too early)
-        if min_version > min_required_ver:
+        if _exceeds(
+            min_version,
+            release_tuple(min_version),
+            min_required_ver,
+            schedule.release_tuple(min_required),
+        ):
             reporter.add_error(
                 package="python",
                 message=f"requires-python = \"{requires_python}\" drops support for Python {min_required} too early",
@@ -254,51 +304,62 @@ def _check_python_version(
 
     # Check upper bound - ERROR if it excludes a Python version that must_be_supported(now)
     if bounds.has_upper_constraint and bounds.upper:
-        for py_version, py_info in schedule.python.items():
-            if py_info.must_be_supported(now):
-                py_ver = Version(py_version)
-                # Check if this required version is excluded by the upper bound
-                if bounds.upper_inclusive:
-                    excluded = py_ver > bounds.upper
-                else:
-                    excluded = py_ver >= bounds.upper
-
-                if excluded:
-                    reporter.add_error(
-                        package="python",
-                        message=f"requires-python = \"{requires_python}\" blocks adoption of Python {py_version}",
-                        details=f"Python {py_version} must be supported within 6 months of release per PHEP 3",
-                        suggestion=f"Remove upper bound or update to include Python {py_version}",
-                    )
+        upper_key = bounds.upper_release
+        for py_version, py_ver in required_pythons:
+            # Check if this required version is excluded by the upper bound
+            if _exceeds(
+                py_ver,
+                schedule.release_tuple(py_version),
+                bounds.upper,
+                upper_key,
+                inclusive=bounds.upper_inclusive,
+            ):
+                reporter.add_error(
+                    package="python",
+                    message=f"requires-python = \"{requires_python}\" blocks adoption of Python {py_version}",
+                    details=f"Python {py_version} must be supported within 6 months of release per PHEP 3",
+                    suggestion=f"Remove upper bound or update to include Python {py_version}",
+                )
 
     # Check exclusions - ERROR if a required version is excluded
     if bounds.exclusions:
-        for py_version, py_info in schedule.python.items():
-            if py_info.must_be_supported(now):
-                py_ver = Version(py_version)
-                # Check if excluded (need to match major.minor)
-                for excl in bounds.exclusions:
-                    if excl.major == py_ver.major and excl.minor == py_ver.minor:
-                        reporter.add_error(
-                            package="python",
-                            message=f"requires-python = \"{requires_python}\" excludes required Python {py_version}",
-                            details=f"Python {py_version} must be supported per PHEP 3",
-                            suggestion=f"Remove !={excl} from requires-python",
-                        )
+        # Exclusions match on major.minor
+        excl_by_minor: dict[tuple[int, int], list[Version]] = {}
+        for excl in bounds.exclusions:
+            excl_by_minor.setdefault((excl.major, excl.minor), []).append(excl)
+
+        for py_version, py_ver in required_pythons:
+            for excl in excl_by_minor.get((py_ver.major, py_ver.minor), ()):
+                reporter.add_error(
+                    package="python",
+                    message=f"requires-python = \"{requires_python}\" excludes required Python {py_version}",
+                    details=f"Python {py_version} must be supported per PHEP 3",
+                    suggestion=f"Remove !={excl} from requires-python",
+                )
 
     # Check exact pin (non-wildcard) - ERROR if it excludes a required version
     if bounds.exact and not bounds.is_wildcard:
-        for py_version, py_info in schedule.python.items():
-            if py_info.must_be_supported(now):
-                py_ver = Version(py_version)
-                # Exact pin only allows the pinned version
-                if not (bounds.exact.major == py_ver.major and bounds.exact.minor == py_ver.minor):
-                    reporter.add_error(
-                        package="python",
-                        message=f"requires-python = \"{requires_python}\" excludes required Python {py_version}",
-                        details=f"Exact pin only allows Python {bounds.exact.major}.{bounds.exact.minor}, but {py_version} must be supported per PHEP 3",
-                        suggestion=f"Use >= instead of == to allow newer Python versions",
-                    )
+        exact_minor = (bounds.exact.major, bounds.exact.minor)
+        for py_version, py_ver in required_pythons:
+            # Exact pin only allows the pinned version
+            if (py_ver.major, py_ver.minor) != exact_minor:
+                reporter.add_error(
+                    package="python",
+                    message=f"requires-python = \"{requires_python}\" excludes required Python {py_version}",
+                    details=f"Exact pin only allows Python {bounds.exact.major}.{bounds.exact.minor}, but {py_version} must be supported per PHEP 3",
+                    suggestion=f"Use >= instead of == to allow newer Python versions",
+                )
+
+
+def _required_python_versions(
+    schedule: Schedule, now: datetime
+) -> list[tuple[str, Version]]:
+    """Return (version string, Version) pairs for Pythons that must be supported."""
+    return [
+        (py_version, schedule.parsed_version(py_version))
+        for py_version, py_info in schedule.python.items()
+        if py_info.must_be_supported(now)
+    ]
 
 
 def _check_dependency(
@@ -310,6 +371,7 @@ def _check_dependency(
     supported_python_versions: list[str],
     context: str = "base",
     report_as_warning: bool = False,
+    required_by_package: dict[str, list[tuple[str, Version]]] | None = None,
 ):
     """Check a single dependency for PHEP 3 compliance.
 
@@ -322,9 +384,11 @@ def _check_dependency(
         supported_python_versions: List of Python versions to consider
         context: Context label for reporting (e.g., "base", "dev", "image")
         report_as_warning: If True, report errors as warnings (used for extras)
+        required_by_package: Per-check memo of must-be-supported versions,
+            keyed by schedule package name
     """
     # Only check core packages
-    if not is_core_package(dep.name):
+    if dep.pep503_name not in CORE_PACKAGES_NORMALIZED:
         return
 
     # URL dependencies can't be checked
@@ -332,12 +396,12 @@ def _check_dependency(
         return
 
     # Get the normalized package name for schedule lookup
-    pkg_name = _get_schedule_package_name(dep.name, schedule)
+    pkg_name = schedule.normalized_package_index.get(dep.pep503_name)
     if not pkg_name:
         # Package not in schedule - can't check
         return
 
-    bounds = extract_version_bounds(dep.specifier)
+    bounds = _extract_version_bounds_cached(str(dep.specifier or ""))
 
     marker_applicability = _get_python_marker_applicability(
         dep.markers, supported_python_versions
@@ -347,50 +411,31 @@ def _check_dependency(
 
     downgrade_lower_bound = marker_applicability == "some"
 
-    # Helper to report issues with correct severity
-    def _report_warning(package: str, message: str, details: str = "", suggestion: str = ""):
-        reporter.add_warning(
-            package=package,
-            message=message,
-            details=details,
-            suggestion=suggestion,
-            context=context if context != "base" else "",
-        )
-
-    def _report_error(package: str, message: str, details: str = "", suggestion: str = ""):
-        if report_as_warning:
-            reporter.add_warning(
-                package=package,
-                message=message,
-                details=details,
-                suggestion=suggestion,
-                context=context,
-            )
-        else:
-            reporter.add_error(
-                package=package,
-                message=message,
-                details=details,
-                suggestion=suggestion,
-                context=context if context != "base" else "",
-            )
+    # Context for reporting (omit "base" from output)
+    report_context = context if context != "base" else ""
 
     # Check for upper bound / exact constraints (warning)
     if bounds.has_max_constraint:
         if bounds.exact:
             if bounds.is_wildcard:
-                _report_warning(
+                _emit(
+                    reporter,
+                    "warning",
                     package=dep.name,
                     message=f"{dep.raw} has wildcard version constraint",
                     details=f"Wildcard constraints create an implicit upper bound (<{bounds.upper})",
                     suggestion=f"Consider using >= instead for better compatibility",
+                    context=report_context,
                 )
             else:
-                _report_warning(
+                _emit(
+                    reporter,
+                    "warning",
                     package=dep.name,
                     message=f"{dep.raw} has exact version constraint",
                     details="Exact constraints should only be used when absolutely necessary",
                     suggestion=f"Remove exact constraint and use >= instead",
+                    context=report_context,
                 )
         elif bounds.upper:
             # Check if this is from a ~= constraint
@@ -398,25 +443,37 @@ def _check_dependency(
                 spec.operator == "~=" for spec in (dep.specifier or [])
             )
             if has_tilde_equals:
-                _report_warning(
+                _emit(
+                    reporter,
+                    "warning",
                     package=dep.name,
                     message=f"{dep.raw} has implicit upper bound from ~=",
                     details=f"The ~= operator creates an implicit upper bound (<{bounds.upper})",
                     suggestion=f"Consider using >= instead for better compatibility",
+                    context=report_context,
                 )
             else:
-                _report_warning(
+                _emit(
+                    reporter,
+                    "warning",
                     package=dep.name,
                     message=f"{dep.raw} has upper bound constraint",
                     details="Upper bounds should only be used when absolutely necessary",
                     suggestion=f"Consider removing <{bounds.upper} unless required",
+                    context=report_context,
                 )
 
+    # Both remaining checks only apply when the schedule has versions
+    pkg_versions = schedule.packages.get(pkg_name, {})
+    if not pkg_versions:
+        return
+
     # Check lower bound
     if bounds.lower:
         _check_lower_bound(
             dep,
-            pkg_name,
+            pkg_versions,
+            schedule.get_minimum_package_version(pkg_name, now),
             bounds.lower,
             schedule,
             reporter,
@@ -431,28 +488,67 @@ def _check_dependency(
         _check_adoption(
             dep,
             pkg_name,
+            bounds,
             schedule,
             reporter,
             now,
             context=context,
             report_as_warning=report_as_warning,
+            required_by_package=required_by_package,
         )
 
 
-def _get_schedule_package_name(name: str, schedule: Schedule) -> str | None:
-    """Find the package name as it appears in the schedule."""
-    normalized = normalize_package_name(name)
+@functools.lru_cache(maxsize=4096)
+def _extract_version_bounds_cached(spec_str: str) -> VersionBounds:
+    """Extract version bounds for a specifier string, memoized by the string.
+
+    SpecifierSet hashing depends on its parsed form, so the string is used as
+    the cache key. The returned bounds are shared and must not be mutated.
+    """
+    return extract_version_bounds(SpecifierSet(spec_str) if spec_str else None)
+
+
+def _exceeds(
+    version: Version,
+    version_key: tuple[int, int, int] | None,
+    bound: Version,
+    bound_key: tuple[int, int, int] | None,
+    inclusive: bool = True,
+) -> bool:
+    """Return True if version is above bound (or equal to it, if not inclusive).
+
+    The release tuples are compared when both are available, which avoids
+    Version's full comparison; otherwise the Version objects are compared.
+    """
+    if version_key is not None and bound_key is not None:
+        return version_key > bound_key if inclusive else version_key >= bound_key
+    return version > bound if inclusive else version >= bound
 
-    for pkg_name in schedule.packages:
-        if normalize_package_name(pkg_name) == normalized:
-            return pkg_name
 
-    return None
+def _emit(
+    reporter: Reporter,
+    severity: str,
+    package: str,
+    message: str,
+    details: str = "",
+    suggestion: str = "",
+    context: str = "",
+):
+    """Report an issue to the reporter as an "error" or a "warning"."""
+    add = reporter.add_error if severity == "error" else reporter.add_warning
+    add(
+        package=package,
+        message=message,
+        details=details,
+        suggestion=suggestion,
+        context=context,
+    )
 
 
 def _check_lower_bound(
     dep: ParsedDependency,
-    pkg_name: str,
+    pkg_versions: dict[str, VersionSchedule],
+    min_supported: str | None,
     lower_bound: Version,
     schedule: Schedule,
     reporter: Reporter,
@@ -461,24 +557,23 @@ def _check_lower_bound(
     context: str = "base",
     report_as_warning: bool = False,
 ):
-    """Check if the lower bound violates PHEP 3 requirements."""
-    pkg_versions = schedule.packages.get(pkg_name, {})
-    if not pkg_versions:
-        return
+    """Check if the lower bound violates PHEP 3 requirements.
 
+    pkg_versions is the package's schedule entry and min_supported the
+    minimum version that must still be supported, both looked up by the caller.
+    """
     # Get version string (e.g., "1.26" from Version("1.26.0"))
     version_str = f"{lower_bound.major}.{lower_bound.minor}"
-
-    # Get the minimum version that MUST still be supported
-    min_supported = schedule.get_minimum_package_version(pkg_name, now)
+    lower_key = release_tuple(lower_bound)
 
     # Context for reporting (omit "base" from output)
     report_context = context if context != "base" else ""
 
     if min_supported:
-        min_ver = Version(min_supported)
+        min_ver = schedule.parsed_version(min_supported)
+        min_key = schedule.release_tuple(min_supported)
         # ERROR if lower bound is higher than minimum required (drops support too early)
-        if lower_bound > min_ver:
+        if _exceeds(lower_bound, lower_key, min_ver, min_key):
             if downgrade_error or report_as_warning:
                 if downgrade_error:
                     suggestion = (
@@ -520,8 +615,9 @@ def _check_lower_bound(
         )
     elif not version_info and min_supported:
         # Version not in schedule - check if it's older than minimum
-        min_ver = Version(min_supported)
-        if lower_bound < min_ver:
+        min_ver = schedule.parsed_version(min_supported)
+        min_key = schedule.release_tuple(min_supported)
+        if _exceeds(min_ver, min_key, lower_bound, lower_key):
             reporter.add_warning(
                 package=dep.name,
                 message=f"{dep.name} {version_str} support can be dropped per PHEP 3",
@@ -534,25 +630,33 @@ def _check_lower_bound(
 def _check_adoption(
     dep: ParsedDependency,
     pkg_name: str,
+    bounds: VersionBounds,
     schedule: Schedule,
     reporter: Reporter,
     now: datetime,
     context: str = "base",
     report_as_warning: bool = False,
+    required_by_package: dict[str, list[tuple[str, Version]]] | None = None,
 ):
-    """Check if new versions are being adopted within 6 months."""
-    pkg_versions = schedule.packages.get(pkg_name, {})
-    if not pkg_versions:
-        return
+    """Check if new versions are being adopted within 6 months.
 
-    # Find all versions that must be supported now
-    bounds = extract_version_bounds(dep.specifier)
+    pkg_name is the package's key in the schedule and bounds the
+    dependency's version bounds, both computed by the caller.
+    required_by_package memoizes the must-be-supported versions per package
+    for the duration of one check_compliance call.
+    """
+    # Only upper, exact and != constraints can exclude a required version
+    if not bounds.upper and not bounds.exact and not bounds.exclusions:
+        return
 
     # Collect all required versions and check which are allowed
-    required_versions = []
-    for version_str, version_info in pkg_versions.items():
-        if version_info.must_be_supported(now):
-            required_versions.append((version_str, Version(version_str)))
+    if required_by_package is None:
+        required_by_package = {}
+    required_versions = required_by_package.get(pkg_name)
+    if required_versions is None:
+        required_versions = required_by_package[pkg_name] = (
+            schedule.must_be_supported_versions(pkg_name, now)
+        )
 
     if not required_versions:
         return
@@ -562,15 +666,34 @@ def _check_adoption(
     excluded_by_exact = []
     excluded_by_not_equal = []
 
+    # Exact and != constraints match on major.minor
+    exact_minor = (bounds.exact.major, bounds.exact.minor) if bounds.exact else None
+    excl_minors = frozenset((e.major, e.minor) for e in bounds.exclusions)
+
+    # The upper bound can only exclude anything if the newest required
+    # version reaches it, so test that once before checking every version
+    check_upper = bounds.upper is not None
+    upper_key = bounds.upper_release
+    if check_upper and upper_key is not None:
+        required_keys = [schedule.release_tuple(v) for v, _ in required_versions]
+        if None not in required_keys:
+            newest = max(required_keys)
+            check_upper = (
+                newest > upper_key if bounds.upper_inclusive else newest >= upper_key
+            )
+
     for version_str, version in required_versions:
-        # Check if excluded by upper bound
-        if bounds.upper:
-            if bounds.upper_inclusive:
-                excluded = version > bounds.upper
-            else:
-                excluded = version >= bounds.upper
+        version_minor = (version.major, version.minor)
 
-            if excluded:
+        # Check if excluded by upper bound
+        if check_upper:
+            if _exceeds(
+                version,
+                schedule.release_tuple(version_str),
+                bounds.upper,
+                bounds.upper_release,
+                inclusive=bounds.upper_inclusive,
+            ):
                 excluded_by_upper.append(version_str)
                 continue
 
@@ -578,56 +701,40 @@ def _check_adoption(
         if bounds.exact:
             # For exact constraints, only the exact version is allowed
             # Check if major.minor matches (e.g., ==1.26.0 should allow 1.26)
-            if not (bounds.exact.major == version.major and bounds.exact.minor == version.minor):
+            if version_minor != exact_minor:
                 excluded_by_exact.append(version_str)
                 continue
 
         # Check if excluded by != constraints
-        if bounds.exclusions:
-            for excl in bounds.exclusions:
-                # Match on major.minor
-                if excl.major == version.major and excl.minor == version.minor:
-                    excluded_by_not_equal.append(version_str)
-                    break
+        if version_minor in excl_minors:
+            excluded_by_not_equal.append(version_str)
 
     # Context for reporting (omit "base" from output)
     report_context = context if context != "base" else ""
-
-    # Helper to report errors (as warnings if report_as_warning is True)
-    def _report_error(package: str, message: str, details: str, suggestion: str):
-        if report_as_warning:
-            reporter.add_warning(
-                package=package,
-                message=message,
-                details=details,
-                suggestion=suggestion,
-                context=report_context,
-            )
-        else:
-            reporter.add_error(
-                package=package,
-                message=message,
-                details=details,
-                suggestion=suggestion,
-                context=report_context,
-            )
+    error_severity = "warning" if report_as_warning else "error"
 
     # Report errors for versions excluded by upper bound
     for version_str in excluded_by_upper:
-        _report_error(
+        _emit(
+            reporter,
+            error_severity,
             package=dep.name,
             message=f"{dep.raw} does not support required version {version_str}",
             details=f"Version {version_str} must be supported within 6 months of release",
             suggestion=f"Update upper bound to include {version_str}",
+            context=report_context,
         )
 
     # Report errors for versions excluded by exact constraint
     for version_str in excluded_by_exact:
-        _report_error(
+        _emit(
+            reporter,
+            error_severity,
             package=dep.name,
             message=f"{dep.raw} does not support required version {version_str}",
             details=f"Exact constraint prevents supporting {version_str}",
             suggestion=f"Remove exact constraint",
+            context=report_context,
         )
 
     # For != exclusions, only error if ALL required versions are excluded
@@ -639,11 +746,14 @@ def _check_adoption(
 
     if excluded_by_not_equal and not allowed_versions:
         # All required versions are excluded
-        _report_error(
+        _emit(
+            reporter,
+            error_severity,
             package=dep.name,
             message=f"{dep.raw} excludes all required versions",
             details=f"Exclusions prevent supporting any of: {', '.join(excluded_by_not_equal)}",
             suggestion=f"Remove exclusions or ensure at least one required version is allowed",
+            context=report_context,
         )
 
 
@@ -660,7 +770,21 @@ def _get_supported_python_versions(
     except InvalidSpecifier:
         return supported
 
-    return [v for v in supported if spec.contains(v, prereleases=True)]
+    # Plain comparison operators reduce to an interval, so compare parsed
+    # versions directly instead of going through SpecifierSet.contains
+    interval = []
+    for item in spec:
+        compare = _INTERVAL_OPERATORS.get(item.operator)
+        if compare is None or item.version.endswith(".*"):
+            return [v for v in supported if spec.contains(v, prereleases=True)]
+        interval.append((compare, schedule.parsed_version(item.version)))
+
+    result = []
+    for v in supported:
+        version = schedule.parsed_version(v)
+        if all(compare(version, bound) for compare, bound in interval):
+            result.append(v)
+    return result
 
 
 def _get_python_marker_applicability(
@@ -673,23 +797,34 @@ def _get_python_marker_applicability(
     if "python_version" not in markers and "python_full_version" not in markers:
         return None
 
-    try:
-        marker = Marker(markers)
-    except InvalidMarker:
+    marker = _parse_marker(markers)
+    if marker is None:
         return None
 
-    results = []
+    # Marker.evaluate() fills in the rest of the default environment itself,
+    # so only the Python version keys need to be passed
+    any_true = False
+    any_false = False
     for version in supported_python_versions:
-        env = default_environment()
-        env["python_version"] = version
-        env["python_full_version"] = f"{version}.0"
-        results.append(marker.evaluate(env))
+        env = {"python_version": version, "python_full_version": f"{version}.0"}
+        if marker.evaluate(env):
+            any_true = True
+        else:
+            any_false = True
+        # Mixed results can't change further
+        if any_true and any_false:
+            return "some"
 
-    if all(results):
-        return "all"
-    if any(results):
-        return "some"
-    return "none"
+    return "all" if any_true else "none"
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_marker(markers: str) -> Marker | None:
+    """Parse a marker string once; returns None if it is invalid."""
+    try:
+        return Marker(markers)
+    except InvalidMarker:
+        return None
 
 
 def check_pyproject(
@@ -699,6 +834,8 @@ def check_pyproject(
     fail_on_warning: bool = False,
     use_uv_fallback: bool = True,
     ignore_errors_for: set[str] | None = None,
+    use_metadata_cache: bool = False,
+    output: TextIO | None = None,
 ) -> tuple[bool, Reporter]:
     """High-level function to check a pyproject.toml file.
 
@@ -709,15 +846,17 @@ def check_pyproject(
         fail_on_warning: Whether warnings should cause failure
         use_uv_fallback: Whether to use uv for projects with non-PEP 621 metadata
         ignore_errors_for: Set of package names (lowercase) to treat errors as warnings
+        use_metadata_cache: Whether uv metadata extraction may use the on-disk cache
+        output: Stream for the reporter's output (defaults to stdout)
 
     Returns:
         Tuple of (passed, reporter)
     """
-    reporter = Reporter(title="PHEP 3 Compliance Check")
+    reporter = Reporter(title="PHEP 3 Compliance Check", output=output)
 
     # Load or create schedule
     if schedule_path and Path(schedule_path).exists():
-        schedule = Schedule.from_file(schedule_path)
+        schedule = _load_schedule(schedule_path)
     else:
         # Create minimal schedule from built-in Python dates
         from pyhc_actions.phep3.schedule import create_python_schedule
@@ -740,6 +879,7 @@ def check_pyproject(
         check_adoption=check_adoption,
         use_uv_fallback=use_uv_fallback,
         ignore_errors_for=ignore_errors_for,
+        use_metadata_cache=use_metadata_cache,
     )
 
     # Adjust for fail_on_warning
@@ -747,3 +887,23 @@ def check_pyproject(
         passed = False
 
     return passed, reporter
+
+
+def _load_schedule(schedule_path: str | Path) -> Schedule:
+    """Load a schedule file, reusing the parse while its contents are unchanged.
+
+    Safe to call from several threads; the file is parsed only once. The
+    cached schedule has its lazy caches primed, and each caller gets its own
+    copy of it.
+    """
+    key = str(schedule_path)
+    raw = Path(schedule_path).read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+
+    with _SCHEDULE_CACHE_LOCK:
+        cached = _SCHEDULE_CACHE.get(key)
+        if cached is None or cached[0] != digest:
+            schedule = Schedule.from_dict(json.loads(raw))
+            schedule.prime_caches()
+            cached = _SCHEDULE_CACHE[key] = (digest, schedule)
+        return copy.deepcopy(cached[1])
@@ -1,5 +1,9 @@
 """PHEP 3 configuration constants."""
 
+import re
+
+from pyhc_actions.common.parser import normalize_package_name
+
 # Support windows as defined by PHEP 3
 # Python versions supported for 36 months after release
 PYTHON_SUPPORT_MONTHS = 36
@@ -25,11 +29,6 @@ CORE_PACKAGES = frozenset([
     "zarr",
 ])
 
-# Normalized names for core packages (for matching)
-CORE_PACKAGES_NORMALIZED = frozenset([
-    name.lower().replace("-", "_") for name in CORE_PACKAGES
-])
-
 # Known Python release dates (from PHEP 3)
 # Updated periodically; can be supplemented by schedule.json
 PYTHON_RELEASES = {
@@ -42,19 +41,28 @@ PYTHON_RELEASES = {
 }
 
 
-def normalize_package_name(name: str) -> str:
-    """Normalize a package name for comparison.
+# PEP 503 normalized names for core packages (for matching)
+CORE_PACKAGES_NORMALIZED = frozenset(normalize_package_name(p) for p in CORE_PACKAGES)
 
-    PEP 503: Names should be lowercased with runs of underscores,
-    hyphens, and periods replaced with a single hyphen.
+# First character that can't be part of the name in a PEP 508 string
+_NAME_END_RE = re.compile(r"[<>=!~;\[\s(@]")
+
+
+def fast_package_name(dep_str: str) -> str:
+    """Extract the normalized package name from a dependency string.
+
+    Only the leading name is read, without a full PEP 508 parse, so this can
+    be used to filter dependency strings cheaply before parsing them.
 
     Args:
-        name: Package name to normalize
+        dep_str: Dependency string like "numpy>=1.20; python_version<'3.12'"
 
     Returns:
         Normalized package name
     """
-    return name.lower().replace("_", "-").replace(".", "-")
+    dep_str = dep_str.strip()
+    match = _NAME_END_RE.search(dep_str)
+    return normalize_package_name(dep_str[: match.start()] if match else dep_str)
 
 
 def is_core_package(name: str) -> bool:
@@ -66,8 +74,4 @@ def is_core_package(name: str) -> bool:
     Returns:
         True if the package is a core package
     """
-    normalized = normalize_package_name(name)
-    # Also check with underscores for packages like scikit_image
-    alt_normalized = name.lower().replace("-", "_").replace(".", "_")
-
-    return normalized in [normalize_package_name(p) for p in CORE_PACKAGES] or alt_normalized in CORE_PACKAGES_NORMALIZED
+    return normalize_package_name(name) in CORE_PACKAGES_NORMALIZED
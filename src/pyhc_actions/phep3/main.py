@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import argparse
+import io
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-
-from pyhc_actions.phep3.checker import check_pyproject
+from typing import TextIO
 
 
 def main(args: list[str] | None = None) -> int:
@@ -25,16 +27,18 @@ def main(args: list[str] | None = None) -> int:
 Examples:
   %(prog)s                          # Check ./pyproject.toml
   %(prog)s path/to/pyproject.toml   # Check specific file
+  %(prog)s a/pyproject.toml b/pyproject.toml  # Check several projects
   %(prog)s --fail-on-warning        # Treat warnings as errors
   %(prog)s --no-adoption-check      # Skip 6-month adoption check
         """,
     )
 
     parser.add_argument(
-        "project_file",
-        nargs="?",
-        default="pyproject.toml",
-        help="Path to pyproject.toml file (default: pyproject.toml)",
+        "project_files",
+        nargs="*",
+        default=["pyproject.toml"],
+        metavar="project_file",
+        help="Path(s) to pyproject.toml files (default: pyproject.toml)",
     )
 
     parser.add_argument(
@@ -63,6 +67,12 @@ Examples:
         help="Disable uv-based metadata extraction for projects with non-PEP 621 metadata",
     )
 
+    parser.add_argument(
+        "--metadata-cache",
+        action="store_true",
+        help="Cache uv-extracted metadata on disk for projects with static metadata",
+    )
+
     parser.add_argument(
         "--generate-schedule",
         action="store_true",
@@ -90,41 +100,13 @@ Examples:
         update_schedule_file(parsed_args.schedule_output)
         return 0
 
-    # Check that project file exists
-    project_path = Path(parsed_args.project_file)
-    if not project_path.exists():
-        # If pyproject.toml doesn't exist, try fallback to setup.py/setup.cfg
-        project_dir = project_path.parent if project_path.name == "pyproject.toml" else Path(".")
-        setup_py = project_dir / "setup.py"
-        setup_cfg = project_dir / "setup.cfg"
-
-        if not parsed_args.no_uv_fallback and (setup_py.exists() or setup_cfg.exists()):
-            # uv fallback enabled and legacy packaging files (setup.py/setup.cfg) exist
-            # Pass project directory to checker instead of pyproject.toml path
-            project_path = project_dir
-        else:
-            # No pyproject.toml and no fallback available
-            if parsed_args.no_uv_fallback:
-                print(f"Error: File not found: {project_path}", file=sys.stderr)
-                print(f"Hint: Enable uv fallback to support setup.py/setup.cfg", file=sys.stderr)
-            else:
-                print(f"Error: File not found: {project_path}", file=sys.stderr)
-                print(f"Hint: No setup.py or setup.cfg found for fallback", file=sys.stderr)
+    # Check that project files exist
+    project_paths = []
+    for project_file in parsed_args.project_files:
+        project_path = _resolve_project_path(Path(project_file), parsed_args.no_uv_fallback)
+        if project_path is None:
             return 1
-
-    # Find schedule file
-    schedule_path = parsed_args.schedule
-    if schedule_path is None:
-        # Look for schedule.json in common locations
-        candidates = [
-            Path("schedule.json"),
-            project_path.parent / "schedule.json",
-            Path(__file__).parent.parent.parent.parent / "schedule.json",
-        ]
-        for candidate in candidates:
-            if candidate.exists():
-                schedule_path = candidate
-                break
+        project_paths.append(project_path)
 
     # Parse ignore-errors-for into a set of normalized package names
     ignore_errors_for: set[str] = set()
@@ -135,21 +117,110 @@ Examples:
             if name.strip()
         }
 
-    # Run compliance check
-    passed, reporter = check_pyproject(
-        pyproject_path=project_path,
-        schedule_path=schedule_path,
-        check_adoption=not parsed_args.no_adoption_check,
-        fail_on_warning=parsed_args.fail_on_warning,
-        use_uv_fallback=not parsed_args.no_uv_fallback,
-        ignore_errors_for=ignore_errors_for,
-    )
+    # Run compliance checks (imported here so --help and schedule generation
+    # don't pay for loading the checker)
+    from pyhc_actions.phep3 import checker
+
+    def run_check(project_path: Path, output: TextIO | None = None):
+        return checker.check_pyproject(
+            pyproject_path=project_path,
+            schedule_path=_find_schedule(parsed_args.schedule, project_path),
+            check_adoption=not parsed_args.no_adoption_check,
+            fail_on_warning=parsed_args.fail_on_warning,
+            use_uv_fallback=not parsed_args.no_uv_fallback,
+            ignore_errors_for=ignore_errors_for,
+            use_metadata_cache=parsed_args.metadata_cache,
+            output=output,
+        )
+
+    # Several projects are checked concurrently; the parsed schedule is cached
+    # by the checker, so it is only loaded once. Threads rather than processes,
+    # as the slow path is waiting on uv subprocesses. Each project's notes are
+    # buffered so concurrent checks don't interleave on stdout.
+    if len(project_paths) == 1:
+        buffers: list[io.StringIO | None] = [None]
+        results = [run_check(project_paths[0])]
+    else:
+        buffers = [io.StringIO() for _ in project_paths]
+        max_workers = min(len(project_paths), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(run_check, project_paths, buffers))
+
+    # Output results in the order the projects were given
+    exit_code = 0
+    for project_path, buffer, (_, reporter) in zip(project_paths, buffers, results):
+        if buffer is not None:
+            sys.stdout.write(buffer.getvalue())
+            reporter.output = sys.stdout
+            reporter.title = f"{reporter.title}: {project_path}"
+        reporter.print_report()
+        reporter.write_github_summary()
+        exit_code = max(
+            exit_code, reporter.get_exit_code(fail_on_warning=parsed_args.fail_on_warning)
+        )
+
+    return exit_code
+
+
+def _resolve_project_path(project_path: Path, no_uv_fallback: bool) -> Path | None:
+    """Return the path to check for a project file given on the command line.
+
+    Falls back to the project directory when pyproject.toml is missing but
+    setup.py/setup.cfg exist and uv fallback is enabled.
+
+    Args:
+        project_path: Path given on the command line
+        no_uv_fallback: Whether uv-based metadata extraction is disabled
+
+    Returns:
+        Path to check, or None (after printing an error) if there is none
+    """
+    if project_path.exists():
+        return project_path
+
+    # If pyproject.toml doesn't exist, try fallback to setup.py/setup.cfg
+    project_dir = project_path.parent if project_path.name == "pyproject.toml" else Path(".")
+    setup_py = project_dir / "setup.py"
+    setup_cfg = project_dir / "setup.cfg"
+
+    if not no_uv_fallback and (setup_py.exists() or setup_cfg.exists()):
+        # uv fallback enabled and legacy packaging files (setup.py/setup.cfg) exist
+        # Pass project directory to checker instead of pyproject.toml path
+        return project_dir
+
+    # No pyproject.toml and no fallback available
+    if no_uv_fallback:
+        print(f"Error: File not found: {project_path}", file=sys.stderr)
+        print(f"Hint: Enable uv fallback to support setup.py/setup.cfg", file=sys.stderr)
+    else:
+        print(f"Error: File not found: {project_path}", file=sys.stderr)
+        print(f"Hint: No setup.py or setup.cfg found for fallback", file=sys.stderr)
+    return None
 
-    # Output results
-    reporter.print_report()
-    reporter.write_github_summary()
 
-    return reporter.get_exit_code(fail_on_warning=parsed_args.fail_on_warning)
+def _find_schedule(schedule_path: str | None, project_path: Path) -> str | Path | None:
+    """Return the schedule file to use for a project.
+
+    Args:
+        schedule_path: Schedule path given with --schedule, if any
+        project_path: Path of the project being checked
+
+    Returns:
+        Path to schedule.json, or None if none was found
+    """
+    if schedule_path is not None:
+        return schedule_path
+
+    # Look for schedule.json in common locations
+    candidates = [
+        Path("schedule.json"),
+        project_path.parent / "schedule.json",
+        Path(__file__).parent.parent.parent.parent / "schedule.json",
+    ]
+    for candidate in candidates:
+        if candidate.exists():
+            return candidate
+    return None
 
 
 if __name__ == "__main__":
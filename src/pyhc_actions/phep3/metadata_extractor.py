@@ -2,16 +2,82 @@
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
+import os
+import shutil
 import subprocess
 import tempfile
-from dataclasses import dataclass
+import threading
+import tomllib
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from pyhc_actions.phep3.schedule import Schedule
 
+# Declarative packaging files whose contents fully determine the extracted
+# metadata, provided the project has no dynamic metadata
+_METADATA_SOURCE_FILES = ("pyproject.toml", "setup.cfg")
+
+# setup.cfg directives that pull metadata from other files
+_SETUP_CFG_DYNAMIC_DIRECTIVES = ("file:", "attr:")
+
+# Venvs shared by extract_metadata_with_uv calls: python_version -> venv path.
+# They live under one temporary root that is removed at interpreter exit.
+_SHARED_VENVS: dict[str, Path] = {}
+_SHARED_VENVS_LOCK = threading.Lock()
+_shared_venv_root: Path | None = None
+
+# Runs inside the temporary venv; reads the distribution name as JSON on stdin
+# and writes the metadata as JSON to the file named by its first argument
+_EXTRACT_SCRIPT = r"""
+import json
+import re
+import sys
+
+EXTRA_RE = re.compile(r"extra\s*==\s*['\"]([^'\"]+)['\"]")
+
+pkg_name = json.load(sys.stdin)
+try:
+    from importlib.metadata import metadata, requires
+
+    meta = metadata(pkg_name)
+    reqs = requires(pkg_name) or []
+
+    # Separate optional dependencies
+    main_deps = []
+    optional_deps = {}
+    for req in reqs:
+        dep, sep, marker = req.partition(';')
+        if not sep:
+            main_deps.append(req)
+            continue
+
+        # Drop the marker; requirements gated on an extra go to that extra
+        dep = dep.strip()
+        match = EXTRA_RE.search(marker) if 'extra' in marker else None
+        if match:
+            optional_deps.setdefault(match.group(1), []).append(dep)
+        else:
+            main_deps.append(dep)
+
+    result = {
+        "name": meta.get("Name", pkg_name),
+        "requires_python": meta.get("Requires-Python"),
+        "dependencies": main_deps,
+        "optional_dependencies": optional_deps,
+    }
+except Exception as e:
+    result = {"error": str(e)}
+
+with open(sys.argv[1], "w") as f:
+    json.dump(result, f)
+sys.exit(1 if "error" in result else 0)
+"""
+
 
 @dataclass
 class PackageMetadata:
@@ -38,6 +104,51 @@ def check_uv_available() -> bool:
         return False
 
 
+def _list_dist_infos(site_dir: Path) -> set[str]:
+    """Return the names of the .dist-info directories in an install directory."""
+    return {p.name for p in site_dir.glob("*.dist-info")}
+
+
+def _shared_venv(python_version: str) -> Path | None:
+    """Return a venv for python_version, creating it on first use.
+
+    The venv itself is never installed into; packages go into per-call
+    --target directories, so one venv can serve every extraction.
+
+    Args:
+        python_version: Python version to use (e.g., "3.10")
+
+    Returns:
+        Path to the venv, or None if it could not be created
+    """
+    global _shared_venv_root
+
+    with _SHARED_VENVS_LOCK:
+        venv_path = _SHARED_VENVS.get(python_version)
+        if venv_path is not None:
+            return venv_path
+
+        if _shared_venv_root is None:
+            _shared_venv_root = Path(tempfile.mkdtemp(prefix="pyhc-actions-venvs-"))
+            atexit.register(shutil.rmtree, _shared_venv_root, ignore_errors=True)
+
+        venv_path = _shared_venv_root / python_version
+        try:
+            result = subprocess.run(
+                ["uv", "venv", "--python", python_version, str(venv_path)],
+                capture_output=True,
+                text=True,
+                timeout=60,
+            )
+            if result.returncode != 0:
+                return None
+        except (subprocess.TimeoutExpired, FileNotFoundError):
+            return None
+
+        _SHARED_VENVS[python_version] = venv_path
+        return venv_path
+
+
 def get_min_phep3_python(schedule: "Schedule") -> str:
     """Get the oldest non-droppable Python version from schedule.
 
@@ -54,71 +165,140 @@ def get_min_phep3_python(schedule: "Schedule") -> str:
     return min_version or "3.12"
 
 
+def _static_metadata_sources(project_path: Path) -> list[Path] | None:
+    """Return the packaging files that fully determine a project's metadata.
+
+    Projects whose metadata can come from anywhere else are not cacheable:
+    a setup.py can run arbitrary code, [project].dynamic fields and Poetry
+    versioning plugins are filled in at build time, and setup.cfg file:/attr:
+    directives read other files.
+
+    Args:
+        project_path: Path to the project directory
+
+    Returns:
+        Existing packaging files to key a cache entry on, or None if the
+        project has none or has dynamic metadata
+    """
+    if (project_path / "setup.py").exists():
+        return None
+
+    sources = [project_path / name for name in _METADATA_SOURCE_FILES]
+    sources = [path for path in sources if path.is_file()]
+    if not sources:
+        return None
+
+    for path in sources:
+        try:
+            text = path.read_text()
+        except (OSError, UnicodeDecodeError):
+            return None
+        if path.name == "setup.cfg":
+            if any(directive in text for directive in _SETUP_CFG_DYNAMIC_DIRECTIVES):
+                return None
+            continue
+        try:
+            data = tomllib.loads(text)
+        except tomllib.TOMLDecodeError:
+            return None
+        tool = data.get("tool", {})
+        if data.get("project", {}).get("dynamic") or "poetry-dynamic-versioning" in tool:
+            return None
+
+    return sources
+
+
+def _metadata_cache_file(project_path: Path, python_version: str) -> Path | None:
+    """Return the on-disk cache file for a project's extracted metadata.
+
+    The key hashes the target Python version and the contents of the
+    packaging files, so an unchanged project hits the cache even from a
+    fresh checkout in a different directory.
+
+    Returns:
+        Cache file path, or None if the project's metadata is not cacheable
+        (see _static_metadata_sources)
+    """
+    sources = _static_metadata_sources(project_path)
+    if sources is None:
+        return None
+
+    digest = hashlib.blake2b(python_version.encode(), digest_size=16)
+    for path in sources:
+        digest.update(b"\0" + path.name.encode() + b"\0")
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            return None
+
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_root / "pyhc-actions" / "uv-meta" / f"{digest.hexdigest()}.json"
+
+
+def _read_cached_metadata(cache_file: Path) -> PackageMetadata | None:
+    """Load cached metadata, or None if missing or unreadable."""
+    try:
+        return PackageMetadata(**json.loads(cache_file.read_bytes()))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _write_cached_metadata(cache_file: Path, metadata: PackageMetadata) -> None:
+    """Store metadata in the cache; failures are ignored."""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(json.dumps(asdict(metadata)))
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
 def extract_metadata_with_uv(
     project_path: Path | str,
     python_version: str | None = None,
+    use_cache: bool = False,
 ) -> PackageMetadata | None:
     """Extract package metadata using uv.
 
     This works for setup.py-only projects and Poetry projects by:
-    1. Creating a temporary venv with a specific Python version
-    2. Installing the package without dependencies
+    1. Creating (or reusing) a venv with a specific Python version
+    2. Installing the package without dependencies into a temporary
+       --target directory
     3. Reading metadata via importlib.metadata
 
+    With use_cache, successful results for projects with static metadata
+    (no setup.py, no dynamic fields) are cached under ~/.cache/pyhc-actions
+    (or $XDG_CACHE_HOME), keyed by the packaging files' contents.
+
     Args:
         project_path: Path to the project directory
         python_version: Python version to use (e.g., "3.10")
+        use_cache: Whether to read and write the on-disk metadata cache
 
     Returns:
         PackageMetadata or None if extraction fails
     """
     project_path = Path(project_path)
+    python_version = python_version or "3.12"
 
     if not check_uv_available():
         return None
 
-    python_version = python_version or "3.12"
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        venv_path = Path(tmpdir) / ".venv"
+    cache_file = _metadata_cache_file(project_path, python_version) if use_cache else None
+    if cache_file is not None:
+        cached = _read_cached_metadata(cache_file)
+        if cached is not None:
+            return cached
 
-        # Create venv with specific Python
-        try:
-            result = subprocess.run(
-                ["uv", "venv", "--python", python_version, str(venv_path)],
-                capture_output=True,
-                text=True,
-                timeout=60,
-                cwd=str(project_path),
-            )
-            if result.returncode != 0:
-                return None
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            return None
+    venv_path = _shared_venv(python_version)
+    if venv_path is None:
+        return None
 
-        # Capture .dist-info directories BEFORE install
-        # We use set difference (before vs after) to find the newly installed package.
-        # This is more reliable than sorting by mtime, which can be wrong in seeded
-        # venvs, concurrent installs, or when tools touch metadata post-install.
-        list_dists_script = """
-import os, sys, json
-site_packages = [p for p in sys.path if 'site-packages' in p]
-if site_packages:
-    dists = [d for d in os.listdir(site_packages[0]) if d.endswith('.dist-info')]
-    print(json.dumps(dists))
-else:
-    print(json.dumps([]))
-"""
-        try:
-            result = subprocess.run(
-                [str(venv_path / "bin" / "python"), "-c", list_dists_script],
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-            dists_before = set(json.loads(result.stdout)) if result.returncode == 0 else set()
-        except (subprocess.TimeoutExpired, json.JSONDecodeError):
-            dists_before = set()
+    # Install into a fresh --target directory, so the only .dist-info in it
+    # is the project's own and the shared venv stays untouched
+    with tempfile.TemporaryDirectory() as tmpdir:
+        target_dir = Path(tmpdir) / "site"
 
         # Install package without dependencies
         try:
@@ -127,6 +307,7 @@ else:
                     "uv", "pip", "install",
                     "--no-deps",
                     "--python", str(venv_path / "bin" / "python"),
+                    "--target", str(target_dir),
                     str(project_path),
                 ],
                 capture_output=True,
@@ -139,70 +320,21 @@ else:
         except (subprocess.TimeoutExpired, FileNotFoundError):
             return None
 
-        # Extract metadata using Python
-        # Pass the "before" set so the script can find the newly installed package
-        dists_before_json = json.dumps(list(dists_before))
-        extract_script = f"""
-import json
-import sys
-DISTS_BEFORE = set(json.loads('''{dists_before_json}'''))
-try:
-    from importlib.metadata import metadata, requires
-    import os
-    site_packages = [p for p in sys.path if 'site-packages' in p][0]
-    dists_after = set(d for d in os.listdir(site_packages) if d.endswith('.dist-info'))
-
-    # Find the newly installed package by set difference
-    new_dists = dists_after - DISTS_BEFORE
-    if not new_dists:
-        print(json.dumps({{"error": "No new package found after install"}}))
-        sys.exit(1)
-
-    # Get package name from the new dist-info (format: NAME-VERSION.dist-info)
-    new_dist = list(new_dists)[0]
-    name_version = new_dist.replace('.dist-info', '')
-    pkg_name = name_version.rsplit('-', 1)[0].replace('_', '-')
-
-    meta = metadata(pkg_name)
-    reqs = requires(pkg_name) or []
-
-    # Separate optional dependencies
-    main_deps = []
-    optional_deps = {{}}
-    for req in reqs:
-        if ';' in req and 'extra' in req:
-            # Parse extra name
-            import re
-            match = re.search(r'extra\\s*==\\s*[' + "'" + r'"]([^' + "'" + r'"]+)[' + "'" + r'"]', req)
-            if match:
-                extra_name = match.group(1)
-                # Remove the marker
-                dep = req.split(';')[0].strip()
-                if extra_name not in optional_deps:
-                    optional_deps[extra_name] = []
-                optional_deps[extra_name].append(dep)
-            else:
-                main_deps.append(req.split(';')[0].strip())
-        elif ';' in req:
-            # Has marker but not extra
-            main_deps.append(req.split(';')[0].strip())
-        else:
-            main_deps.append(req)
+        new_dists = _list_dist_infos(target_dir)
+        if not new_dists:
+            return None
 
-    print(json.dumps({{
-        "name": meta.get("Name", pkg_name),
-        "requires_python": meta.get("Requires-Python"),
-        "dependencies": main_deps,
-        "optional_dependencies": optional_deps,
-    }}))
-except Exception as e:
-    print(json.dumps({{"error": str(e)}}))
-    sys.exit(1)
-"""
+        # Get package name from the new dist-info (format: NAME-VERSION.dist-info)
+        name_version = sorted(new_dists)[0].removesuffix(".dist-info")
+        pkg_name = name_version.rsplit("-", 1)[0].replace("_", "-")
 
+        # The script writes its result to a file, leaving stdout to the venv
+        out_path = Path(tmpdir) / "meta.json"
         try:
             result = subprocess.run(
-                [str(venv_path / "bin" / "python"), "-c", extract_script],
+                [str(venv_path / "bin" / "python"), "-c", _EXTRACT_SCRIPT, str(out_path)],
+                input=json.dumps(pkg_name),
+                env={**os.environ, "PYTHONPATH": str(target_dir)},
                 capture_output=True,
                 text=True,
                 timeout=30,
@@ -210,24 +342,28 @@ except Exception as e:
             if result.returncode != 0:
                 return None
 
-            data = json.loads(result.stdout)
+            data = json.loads(out_path.read_bytes())
             if "error" in data:
                 return None
 
-            return PackageMetadata(
+            metadata = PackageMetadata(
                 name=data.get("name", ""),
                 requires_python=data.get("requires_python"),
                 dependencies=data.get("dependencies", []),
                 optional_dependencies=data.get("optional_dependencies", {}),
                 extracted_via="uv",
             )
-        except (subprocess.TimeoutExpired, json.JSONDecodeError):
+            if cache_file is not None:
+                _write_cached_metadata(cache_file, metadata)
+            return metadata
+        except (subprocess.TimeoutExpired, OSError, json.JSONDecodeError):
             return None
 
 
 def extract_metadata_from_project(
     project_path: Path | str,
     schedule: "Schedule | None" = None,
+    use_cache: bool = False,
 ) -> PackageMetadata | None:
     """Extract metadata from a project, trying multiple methods.
 
@@ -238,6 +374,7 @@ def extract_metadata_from_project(
     Args:
         project_path: Path to project directory or pyproject.toml
         schedule: Optional schedule for determining Python version
+        use_cache: Whether uv extraction may use the on-disk metadata cache
 
     Returns:
         PackageMetadata or None if all methods fail
@@ -287,4 +424,4 @@ def extract_metadata_from_project(
     if schedule:
         python_version = get_min_phep3_python(schedule)
 
-    return extract_metadata_with_uv(project_dir, python_version)
+    return extract_metadata_with_uv(project_dir, python_version, use_cache=use_cache)
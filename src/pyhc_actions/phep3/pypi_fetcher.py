@@ -3,32 +3,77 @@
 from __future__ import annotations
 
 import collections
+import functools
+import json
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from packaging.version import Version, InvalidVersion
 
-from pyhc_actions.phep3.config import CORE_PACKAGES, PACKAGE_SUPPORT_MONTHS, ADOPTION_MONTHS
-from pyhc_actions.phep3.schedule import Schedule, VersionSchedule, create_python_schedule
+from pyhc_actions.phep3.config import CORE_PACKAGES, PACKAGE_SUPPORT_MONTHS
+from pyhc_actions.phep3.schedule import (
+    _ADOPTION_DELTA,
+    Schedule,
+    VersionSchedule,
+    create_python_schedule,
+)
 
 
 PYPI_SIMPLE_URL = "https://pypi.org/simple/{package}"
 
+# Media type of the JSON simple API (PEP 691); without it PyPI serves HTML
+_SIMPLE_JSON_ACCEPT = "application/vnd.pypi.simple.v1+json"
+
+# Concurrent PyPI requests made by fetch_all_core_packages
+_FETCH_WORKERS = 8
+
+# Retry policy for PyPI requests
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=["GET"],
+)
+
+# Process-wide HTTP session, created on first use by _shared_session
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+
+# Releases already fetched in this process: (package, support_months) -> releases
+_RELEASES_CACHE: dict[tuple[str, int], dict[str, VersionSchedule]] = {}
+
 
 def fetch_package_releases(
-    package: str, support_months: int = PACKAGE_SUPPORT_MONTHS
+    package: str,
+    support_months: int = PACKAGE_SUPPORT_MONTHS,
+    session: requests.Session | None = None,
 ) -> dict[str, VersionSchedule]:
     """Fetch release dates for a package from PyPI.
 
     Based on PHEP 3's reference implementation.
 
+    Results are memoized for the rest of the process, and the PyPI response
+    is cached on disk and revalidated with a conditional GET.
+
     Args:
         package: Package name to fetch
         support_months: Support window in months (default 24)
+        session: HTTP session to use (defaults to the shared PyPI session)
 
     Returns:
         Dictionary mapping version strings to VersionSchedule objects
     """
+    cached = _RELEASES_CACHE.get((package, support_months))
+    if cached is not None:
+        return dict(cached)
+
     releases = {}
 
     # Calculate cutoff - include releases from 9 months ago to catch recent drops
@@ -39,37 +84,25 @@ def fetch_package_releases(
     cutoff = current_quarter_start - timedelta(days=270)  # ~9 months
 
     try:
-        response = requests.get(
-            PYPI_SIMPLE_URL.format(package=package),
-            headers={"Accept": "application/vnd.pypi.simple.v1+json"},
-            timeout=30,
-        )
-        response.raise_for_status()
-        data = response.json()
-    except requests.RequestException as e:
+        data = _fetch_simple_index(package, session)
+    except (requests.RequestException, ValueError) as e:
         print(f"Warning: Could not fetch release data for {package}: {e}")
         return releases
 
     # Group upload times by version
     file_dates: dict[Version, list[datetime]] = collections.defaultdict(list)
 
-    for file_info in data.get("files", []):
-        filename = file_info.get("filename", "")
-
-        # Extract version from filename (format: package-version-...)
-        parts = filename.split("-")
-        if len(parts) < 2:
-            continue
-
-        ver_str = parts[1]
+    # Only X.Y.0 final releases matter; other files never reach Version
+    filename_re = _release_filename_re(package)
 
-        try:
-            version = Version(ver_str)
-        except InvalidVersion:
+    for file_info in data.get("files", []):
+        match = filename_re.match(file_info.get("filename", ""))
+        if match is None:
             continue
 
-        # Skip pre-releases and patch versions (we only care about X.Y.0)
-        if version.is_prerelease or version.micro != 0:
+        # Every wheel and sdist of a release repeats the same version string
+        version = _parse_version(match.group(1))
+        if version is None:
             continue
 
         # Parse upload time
@@ -77,25 +110,26 @@ def fetch_package_releases(
         if not upload_time_str:
             continue
 
-        release_date = None
-        for fmt in ["%Y-%m-%dT%H:%M:%S.%fZ", "%Y-%m-%dT%H:%M:%SZ"]:
-            try:
-                release_date = datetime.strptime(upload_time_str, fmt).replace(tzinfo=timezone.utc)
-                break
-            except ValueError:
-                continue
+        # PyPI returns e.g. "2024-06-16T18:05:42.123456Z"; fromisoformat
+        # accepts the "Z" suffix and fractional seconds on Python 3.11+
+        try:
+            release_date = datetime.fromisoformat(upload_time_str)
+        except ValueError:
+            continue
+        if release_date.tzinfo is None:
+            release_date = release_date.replace(tzinfo=timezone.utc)
 
-        if release_date:
-            file_dates[version].append(release_date)
+        file_dates[version].append(release_date)
 
     # Use earliest upload time as release date
+    support_delta = timedelta(days=support_months * 30.44)
     for version, dates in file_dates.items():
         release_date = min(dates)
-        drop_date = release_date + timedelta(days=support_months * 30.44)
+        drop_date = release_date + support_delta
 
         # Only include if drop date is after cutoff
         if drop_date >= cutoff:
-            support_by = release_date + timedelta(days=ADOPTION_MONTHS * 30.44)
+            support_by = release_date + _ADOPTION_DELTA
             version_str = f"{version.major}.{version.minor}"
 
             releases[version_str] = VersionSchedule(
@@ -105,7 +139,127 @@ def fetch_package_releases(
                 support_by=support_by,
             )
 
-    return releases
+    _RELEASES_CACHE[(package, support_months)] = releases
+    return dict(releases)
+
+
+@functools.lru_cache(maxsize=None)
+def _release_filename_re(package: str) -> re.Pattern[str]:
+    """Compile a pattern matching a package's X.Y.0 release filenames.
+
+    Group 1 is the version. The name matches with any of "-", "_" or "."
+    as separators (e.g. both scikit-image-0.24.0.tar.gz and
+    scikit_image-0.24.0-cp312-....whl). Pre-, dev- and post-releases and
+    patch releases do not match.
+    """
+    name = "[-_.]+".join(re.escape(part) for part in re.split(r"[-_.]+", package))
+    return re.compile(
+        rf"^{name}-(\d+\.\d+(?:\.0+)?)(?:-|\.(?:tar\.gz|tar\.bz2|zip|egg)$)",
+        re.IGNORECASE,
+    )
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_version(ver_str: str) -> Version | None:
+    """Parse a version string from a filename, or None if it is invalid."""
+    try:
+        return Version(ver_str)
+    except InvalidVersion:
+        return None
+
+
+def _fetch_simple_index(package: str, session: requests.Session | None = None) -> dict:
+    """Fetch a package's PyPI simple-API JSON, reusing an on-disk copy.
+
+    The cached response is revalidated with If-None-Match/If-Modified-Since,
+    so an unchanged package costs a 304 instead of a full download.
+
+    Args:
+        package: Package name to fetch
+        session: HTTP session to use (defaults to the shared PyPI session)
+
+    Returns:
+        Dictionary with a "files" list of {"filename", "upload-time"} records
+
+    Raises:
+        requests.RequestException: If the request fails
+        ValueError: If the response is not valid JSON
+    """
+    cache_file = _http_cache_file(package)
+    try:
+        cached = json.loads(cache_file.read_bytes())
+    except (OSError, ValueError):
+        cached = None
+
+    # Sent on every request so caller-supplied sessions also get JSON
+    headers = {"Accept": _SIMPLE_JSON_ACCEPT}
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = (session or _shared_session()).get(
+        PYPI_SIMPLE_URL.format(package=package),
+        headers=headers,
+        timeout=30,
+    )
+    if response.status_code == 304 and cached is not None:
+        return cached["body"]
+
+    response.raise_for_status()
+
+    # Decode the raw bytes (skipping requests' charset detection) and keep
+    # only the two fields fetch_package_releases reads from each file
+    data = {
+        "files": [
+            {"filename": f.get("filename", ""), "upload-time": f.get("upload-time", "")}
+            for f in json.loads(response.content).get("files", [])
+        ]
+    }
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_text(
+                json.dumps({"etag": etag, "last_modified": last_modified, "body": data})
+            )
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+
+    return data
+
+
+def _shared_session() -> requests.Session:
+    """Return the process-wide session used for PyPI requests.
+
+    Keep-alive connections in its pool are reused by every fetch, including
+    the concurrent ones made by fetch_all_core_packages. Connection errors
+    and 5xx gateway responses are retried with backoff before a fetch
+    gives up on a package.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            session.headers["Accept"] = _SIMPLE_JSON_ACCEPT
+            adapter = HTTPAdapter(
+                pool_connections=16, pool_maxsize=16, max_retries=_RETRY
+            )
+            session.mount("https://", adapter)
+            _session = session
+        return _session
+
+
+def _http_cache_file(package: str) -> Path:
+    """Return the on-disk cache file for a package's PyPI response."""
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_root / "pyhc-actions" / "pypi" / f"{package}.json"
 
 
 def fetch_all_core_packages() -> dict[str, dict[str, VersionSchedule]]:
@@ -116,13 +270,20 @@ def fetch_all_core_packages() -> dict[str, dict[str, VersionSchedule]]:
     """
     packages = {}
 
-    for package in sorted(CORE_PACKAGES):
-        print(f"Fetching releases for {package}...", end=" ", flush=True)
-        releases = fetch_package_releases(package)
-        packages[package] = releases
-        print(f"found {len(releases)} versions")
-
-    return packages
+    # Requests run concurrently over one session so connections are reused
+    print(f"Fetching releases for {len(CORE_PACKAGES)} packages...", flush=True)
+    session = _shared_session()
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as executor:
+        futures = {
+            executor.submit(fetch_package_releases, package, session=session): package
+            for package in CORE_PACKAGES
+        }
+        for future in as_completed(futures):
+            package = futures[future]
+            packages[package] = future.result()
+            print(f"  {package}: found {len(packages[package])} versions", flush=True)
+
+    return {package: packages[package] for package in sorted(packages)}
 
 
 def generate_schedule() -> Schedule:
@@ -3,19 +3,30 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from functools import cached_property
 from pathlib import Path
 from typing import TypedDict
 
+from packaging.version import InvalidVersion, Version
+
+from pyhc_actions.common.parser import release_tuple
 from pyhc_actions.phep3.config import (
     PYTHON_RELEASES,
     PYTHON_SUPPORT_MONTHS,
     PACKAGE_SUPPORT_MONTHS,
     ADOPTION_MONTHS,
+    normalize_package_name,
 )
 
 
+# Sort key for malformed version strings: after every real release, so one
+# is never picked as a minimum version
+_INVALID_SORT_KEY = (sys.maxsize,)
+
+
 class VersionInfo(TypedDict):
     """Information about a specific version's support timeline."""
 
@@ -24,7 +35,17 @@ class VersionInfo(TypedDict):
     support_by: str  # ISO format, when support must be added
 
 
-@dataclass
+def _to_utc(value: str) -> datetime:
+    """Parse an ISO timestamp from a schedule file as a UTC datetime.
+
+    Saved schedules already carry a +00:00 offset, which fromisoformat maps to
+    timezone.utc, so the tzinfo replacement is skipped for them.
+    """
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo is timezone.utc else parsed.replace(tzinfo=timezone.utc)
+
+
+@dataclass(slots=True, frozen=True)
 class VersionSchedule:
     """Parsed version schedule with datetime objects."""
 
@@ -32,32 +53,49 @@ class VersionSchedule:
     release_date: datetime
     drop_date: datetime
     support_by: datetime
+    # Release numbers of version, for ordering (e.g., (3, 12) for "3.12")
+    _sort_key: tuple[int, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        try:
+            sort_key = tuple(int(p) for p in self.version.split("."))
+        except ValueError:
+            try:
+                sort_key = Version(self.version).release
+            except InvalidVersion:
+                sort_key = _INVALID_SORT_KEY
+        object.__setattr__(self, "_sort_key", sort_key)
 
     @classmethod
     def from_dict(cls, version: str, data: VersionInfo) -> "VersionSchedule":
         """Create from dictionary data."""
         return cls(
-            version=version,
-            release_date=datetime.fromisoformat(data["release_date"]).replace(tzinfo=timezone.utc),
-            drop_date=datetime.fromisoformat(data["drop_date"]).replace(tzinfo=timezone.utc),
-            support_by=datetime.fromisoformat(data["support_by"]).replace(tzinfo=timezone.utc),
+            version,
+            _to_utc(data["release_date"]),
+            _to_utc(data["drop_date"]),
+            _to_utc(data["support_by"]),
         )
 
-    def is_droppable(self, now: datetime | None = None) -> bool:
+    def to_dict(self) -> VersionInfo:
+        """Convert to dictionary data, the inverse of from_dict."""
+        return {
+            "release_date": self.release_date.isoformat(),
+            "drop_date": self.drop_date.isoformat(),
+            "support_by": self.support_by.isoformat(),
+        }
+
+    def is_droppable(self, now: datetime) -> bool:
         """Check if this version can be dropped (past drop_date)."""
-        now = now or datetime.now(timezone.utc)
         return now > self.drop_date
 
-    def must_be_supported(self, now: datetime | None = None) -> bool:
+    def must_be_supported(self, now: datetime) -> bool:
         """Check if this version must be supported (past support_by but not drop_date)."""
-        now = now or datetime.now(timezone.utc)
         return now > self.support_by and now <= self.drop_date
 
-    def months_since_release(self, now: datetime | None = None) -> int:
+    def months_since_release(self, now: datetime) -> int:
         """Return months since release date."""
-        now = now or datetime.now(timezone.utc)
         delta = now - self.release_date
-        return int(delta.days / 30.44)  # Average days per month
+        return delta.days * 100 // 3044  # 30.44 average days per month
 
 
 @dataclass
@@ -67,15 +105,17 @@ class Schedule:
     generated_at: datetime
     python: dict[str, VersionSchedule]
     packages: dict[str, dict[str, VersionSchedule]]
+    _parsed_versions: dict[str, Version] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _release_tuples: dict[str, tuple[int, int, int] | None] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_file(cls, path: Path | str) -> "Schedule":
         """Load schedule from JSON file."""
-        path = Path(path)
-        with open(path) as f:
-            data = json.load(f)
-
-        return cls.from_dict(data)
+        return cls.from_dict(json.loads(Path(path).read_bytes()))
 
     @classmethod
     def from_dict(cls, data: dict) -> "Schedule":
@@ -84,49 +124,78 @@ class Schedule:
         if generated_at.tzinfo is None:
             generated_at = generated_at.replace(tzinfo=timezone.utc)
 
-        python = {}
-        for version, info in data.get("python", {}).items():
-            python[version] = VersionSchedule.from_dict(version, info)
-
-        packages = {}
-        for pkg_name, versions in data.get("packages", {}).items():
-            packages[pkg_name] = {}
-            for version, info in versions.items():
-                packages[pkg_name][version] = VersionSchedule.from_dict(version, info)
+        from_dict = VersionSchedule.from_dict
+        python = {
+            version: from_dict(version, info) for version, info in data.get("python", {}).items()
+        }
+        packages = {
+            pkg_name: {version: from_dict(version, info) for version, info in versions.items()}
+            for pkg_name, versions in data.get("packages", {}).items()
+        }
 
         return cls(generated_at=generated_at, python=python, packages=packages)
 
+    @cached_property
+    def normalized_package_index(self) -> dict[str, str]:
+        """Map normalized package names to their names as keyed in packages.
+
+        Built on first access; the packages mapping is not expected to change
+        after the schedule is loaded.
+        """
+        return {normalize_package_name(name): name for name in self.packages}
+
+    def parsed_version(self, version: str) -> Version:
+        """Return the parsed Version for a schedule version string.
+
+        Parsed versions are cached on the schedule, so each key is only
+        parsed once however many dependencies are checked against it.
+        """
+        parsed = self._parsed_versions.get(version)
+        if parsed is None:
+            parsed = self._parsed_versions[version] = Version(version)
+        return parsed
+
+    def release_tuple(self, version: str) -> tuple[int, int, int] | None:
+        """Return the cached release tuple for a schedule version string.
+
+        See pyhc_actions.common.parser.release_tuple.
+        """
+        if version not in self._release_tuples:
+            self._release_tuples[version] = release_tuple(self.parsed_version(version))
+        return self._release_tuples[version]
+
+    def prime_caches(self) -> None:
+        """Fill the lazy lookup caches for every version in the schedule.
+
+        A primed schedule is only read afterwards, so it can be shared by
+        checks running in several threads.
+        """
+        self.normalized_package_index
+        for versions in (self.python, *self.packages.values()):
+            for version in versions:
+                try:
+                    self.release_tuple(version)
+                except InvalidVersion:
+                    continue
+
     def to_dict(self) -> dict:
         """Convert schedule to dictionary for JSON serialization."""
-        result = {
+        return {
             "generated_at": self.generated_at.isoformat(),
-            "python": {},
-            "packages": {},
+            "python": {
+                version: sched.to_dict() for version, sched in self.python.items()
+            },
+            "packages": {
+                pkg_name: {str(version): sched.to_dict() for version, sched in versions.items()}
+                for pkg_name, versions in self.packages.items()
+            },
         }
 
-        for version, sched in self.python.items():
-            result["python"][version] = {
-                "release_date": sched.release_date.isoformat(),
-                "drop_date": sched.drop_date.isoformat(),
-                "support_by": sched.support_by.isoformat(),
-            }
-
-        for pkg_name, versions in self.packages.items():
-            result["packages"][pkg_name] = {}
-            for version, sched in versions.items():
-                result["packages"][pkg_name][str(version)] = {
-                    "release_date": sched.release_date.isoformat(),
-                    "drop_date": sched.drop_date.isoformat(),
-                    "support_by": sched.support_by.isoformat(),
-                }
-
-        return result
-
     def save(self, path: Path | str):
         """Save schedule to JSON file."""
-        path = Path(path)
-        with open(path, "w") as f:
-            json.dump(self.to_dict(), f, indent=2)
+        # Serialize in one go and write once; json.dump would issue a
+        # write call per token when indenting
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2))
 
     def get_minimum_python_version(self, now: datetime | None = None) -> str | None:
         """Get the minimum Python version that should be supported.
@@ -137,17 +206,14 @@ class Schedule:
 
         # Find all versions that cannot be dropped yet
         supported = [
-            (v, sched)
-            for v, sched in self.python.items()
-            if not sched.is_droppable(now)
+            sched for sched in self.python.values() if not sched.is_droppable(now)
         ]
 
         if not supported:
             return None
 
         # Return the oldest (lowest version)
-        sorted_versions = sorted(supported, key=lambda x: [int(p) for p in x[0].split(".")])
-        return sorted_versions[0][0]
+        return min(supported, key=lambda sched: sched._sort_key).version
 
     def get_minimum_package_version(
         self, package: str, now: datetime | None = None
@@ -164,18 +230,14 @@ class Schedule:
 
         # Find all versions that cannot be dropped yet
         supported = [
-            (v, sched)
-            for v, sched in pkg_versions.items()
-            if not sched.is_droppable(now)
+            v for v, sched in pkg_versions.items() if not sched.is_droppable(now)
         ]
 
         if not supported:
             return None
 
         # Return the oldest
-        from packaging.version import Version
-        sorted_versions = sorted(supported, key=lambda x: Version(x[0]))
-        return sorted_versions[0][0]
+        return min(supported, key=self.parsed_version)
 
     def get_latest_package_version(self, package: str) -> str | None:
         """Get the latest known version of a package."""
@@ -183,8 +245,7 @@ class Schedule:
         if not pkg_versions:
             return None
 
-        from packaging.version import Version
-        return str(max(Version(v) for v in pkg_versions.keys()))
+        return str(max(self.parsed_version(v) for v in pkg_versions.keys()))
 
     def get_required_python_versions(self, now: datetime | None = None) -> list[str]:
         """Get all Python versions that must be supported now.
@@ -231,6 +292,27 @@ class Schedule:
             if sched.must_be_supported(now)
         ]
 
+    def must_be_supported_versions(
+        self, package: str, now: datetime
+    ) -> list[tuple[str, Version]]:
+        """Get the versions of a package that must be supported at ``now``.
+
+        Like get_required_package_versions, but pairs each version string with
+        its parsed Version.
+
+        Args:
+            package: Package name as keyed in packages
+            now: Current time
+
+        Returns:
+            List of (version string, Version) pairs in schedule order
+        """
+        return [
+            (version, self.parsed_version(version))
+            for version, sched in self.packages.get(package, {}).items()
+            if sched.must_be_supported(now)
+        ]
+
     def get_non_droppable_python_versions(self, now: datetime | None = None) -> list[str]:
         """Get all Python versions that cannot be dropped yet.
 
@@ -245,13 +327,11 @@ class Schedule:
         now = now or datetime.now(timezone.utc)
 
         supported = [
-            version
-            for version, sched in self.python.items()
-            if not sched.is_droppable(now)
+            sched for sched in self.python.values() if not sched.is_droppable(now)
         ]
 
         # Sort by version
-        return sorted(supported, key=lambda v: [int(x) for x in v.split(".")])
+        return [sched.version for sched in sorted(supported, key=lambda sched: sched._sort_key)]
 
     def get_non_droppable_package_versions(
         self, package: str, now: datetime | None = None
@@ -273,15 +353,35 @@ class Schedule:
         if not pkg_versions:
             return []
 
-        from packaging.version import Version
-
         supported = [
             version
             for version, sched in pkg_versions.items()
             if not sched.is_droppable(now)
         ]
 
-        return sorted(supported, key=lambda v: Version(v))
+        return sorted(supported, key=self.parsed_version)
+
+
+# Support and adoption windows (30.44 average days per month)
+_PYTHON_SUPPORT_DELTA = timedelta(days=PYTHON_SUPPORT_MONTHS * 30.44)
+_ADOPTION_DELTA = timedelta(days=ADOPTION_MONTHS * 30.44)
+
+
+def _python_release_dates(release_str: str) -> tuple[datetime, datetime, datetime]:
+    """Return (release_date, drop_date, support_by) for a Python release date."""
+    release_date = datetime.fromisoformat(release_str).replace(tzinfo=timezone.utc)
+    return (
+        release_date,
+        release_date + _PYTHON_SUPPORT_DELTA,
+        release_date + _ADOPTION_DELTA,
+    )
+
+
+# PYTHON_RELEASES parsed once: version -> (release_date, drop_date, support_by)
+_PYTHON_RELEASE_DATES = {
+    version: _python_release_dates(release_str)
+    for version, release_str in PYTHON_RELEASES.items()
+}
 
 
 def create_python_schedule() -> dict[str, VersionSchedule]:
@@ -289,13 +389,10 @@ def create_python_schedule() -> dict[str, VersionSchedule]:
     now = datetime.now(timezone.utc)
     schedule = {}
 
-    for version, release_str in PYTHON_RELEASES.items():
-        release_date = datetime.strptime(release_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
-        drop_date = release_date + timedelta(days=PYTHON_SUPPORT_MONTHS * 30.44)
-        support_by = release_date + timedelta(days=ADOPTION_MONTHS * 30.44)
+    # Only include if not yet droppable or recently droppable
+    cutoff = now - timedelta(days=90)  # Include versions dropped in last quarter
 
-        # Only include if not yet droppable or recently droppable
-        cutoff = now - timedelta(days=90)  # Include versions dropped in last quarter
+    for version, (release_date, drop_date, support_by) in _PYTHON_RELEASE_DATES.items():
         if drop_date > cutoff:
             schedule[version] = VersionSchedule(
                 version=version,
@@ -320,5 +417,5 @@ def calculate_dates(
         Tuple of (drop_date, support_by)
     """
     drop_date = release_date + timedelta(days=support_months * 30.44)
-    support_by = release_date + timedelta(days=ADOPTION_MONTHS * 30.44)
+    support_by = release_date + _ADOPTION_DELTA
     return drop_date, support_by
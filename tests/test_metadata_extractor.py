@@ -7,98 +7,70 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 
-class TestExtractScriptSyntax:
-    """Tests for the embedded Python script syntax in metadata_extractor.
+class TestExtractScript:
+    """Tests for the Python script run inside the uv venv.
 
-    The extract_metadata_with_uv function builds a Python script as an f-string
-    and runs it in a subprocess. All literal braces must be escaped as {{ and }}
-    otherwise Python raises a SyntaxError.
+    The script is a fixed module constant that receives the distribution
+    name as JSON on stdin and writes the metadata as JSON to the file named
+    by its first argument.
     """
 
-    def test_fstring_braces_are_valid_python(self):
-        """Test that the f-string generates valid Python code.
+    def test_script_is_syntactically_valid(self):
+        """Test that the extract script compiles."""
+        from pyhc_actions.phep3.metadata_extractor import _EXTRACT_SCRIPT
 
-        This test extracts the script-building logic and verifies
-        that the resulting string is syntactically valid Python.
-        """
-        from pyhc_actions.phep3.metadata_extractor import extract_metadata_with_uv
-        import inspect
-
-        # Get the source code of the function
-        source = inspect.getsource(extract_metadata_with_uv)
-
-        # The function should contain properly escaped braces
-        # These patterns indicate correct escaping in the f-string:
-        assert "optional_deps = {{}}" in source, \
-            "optional_deps initialization should use escaped braces {{}}"
-
-        assert "json.dumps({{" in source, \
-            "json.dumps dict should use escaped braces {{"
-
-    def test_embedded_script_is_syntactically_valid(self):
-        """Test that the generated script is valid Python when evaluated.
-
-        We verify the ACTUAL f-string from the source code produces valid Python.
-        """
-        from pyhc_actions.phep3.metadata_extractor import extract_metadata_with_uv
-        import inspect
-        import re
-
-        # Get the source code
-        source = inspect.getsource(extract_metadata_with_uv)
-
-        # Extract the f-string content (the part between f''' and ''')
-        # The f-string starts after 'extract_script = f"""' and ends at '"""'
-        match = re.search(r'extract_script = f"""(.+?)"""', source, re.DOTALL)
-        assert match is not None, "Could not find extract_script f-string in source"
-
-        fstring_content = match.group(1)
-
-        # Simulate the f-string evaluation with a sample value
-        # The f-string has one interpolation: {dists_before_json}
-        dists_before_json = '["pip-24.0.dist-info"]'
-
-        # Replace the interpolation placeholder
-        # The f-string has: '''{dists_before_json}'''
-        script = fstring_content.replace("{dists_before_json}", dists_before_json)
-
-        # Replace escaped braces: {{ -> { and }} -> }
-        script = script.replace("{{", "{").replace("}}", "}")
-
-        # This should compile without syntax errors
         try:
-            compile(script, "<test>", "exec")
+            compile(_EXTRACT_SCRIPT, "<extract>", "exec")
         except SyntaxError as e:
-            pytest.fail(f"Generated script has syntax error at line {e.lineno}: {e.msg}\n"
+            pytest.fail(f"Extract script has syntax error at line {e.lineno}: {e.msg}\n"
                        f"Problematic line: {e.text}")
 
-    def test_empty_dict_literal_escaping(self):
-        """Test that empty dict {} is properly escaped in f-strings."""
-        # In an f-string, {} would be interpreted as an expression
-        # Must be {{}} to produce literal {}
-
-        # This is what the code does:
-        test_fstring = f"optional_deps = {{}}"
-        assert test_fstring == "optional_deps = {}"
-
-        # Without escaping, this would fail:
-        # f"optional_deps = {}" -> SyntaxError or empty string
+    def test_script_reads_package_name_from_stdin(self, tmp_path):
+        """Test running the script against an installed distribution."""
+        import json
+        import subprocess
+        import sys
+        from pyhc_actions.phep3.metadata_extractor import _EXTRACT_SCRIPT
+
+        out_path = tmp_path / "meta.json"
+        result = subprocess.run(
+            [sys.executable, "-c", _EXTRACT_SCRIPT, str(out_path)],
+            input=json.dumps("pytest"),
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
 
-    def test_dict_in_function_call_escaping(self):
-        """Test that dict literals in function calls are properly escaped."""
-        # json.dumps needs a dict literal
-        error_msg = "test error"
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert result.stdout == ""
+        data = json.loads(out_path.read_text())
+        assert data["name"] == "pytest"
+        assert any(dep.startswith("pluggy") for dep in data["dependencies"])
+        assert all(";" not in dep for dep in data["dependencies"])
+        assert "colorama>=0.4" in data["dependencies"]
+        assert "mock" in data["optional_dependencies"]["dev"]
+        assert all(
+            "mock" not in dep for dep in data["dependencies"]
+        )
 
-        # Properly escaped:
-        test_fstring = f'print(json.dumps({{"error": "{error_msg}"}}))'
-        assert test_fstring == 'print(json.dumps({"error": "test error"}))'
+    def test_script_reports_missing_distribution(self, tmp_path):
+        """Test that an unknown distribution produces an error payload."""
+        import json
+        import subprocess
+        import sys
+        from pyhc_actions.phep3.metadata_extractor import _EXTRACT_SCRIPT
+
+        out_path = tmp_path / "meta.json"
+        result = subprocess.run(
+            [sys.executable, "-c", _EXTRACT_SCRIPT, str(out_path)],
+            input=json.dumps("no-such-distribution-xyz"),
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
 
-        # The generated string should be valid Python
-        # (we can't actually run it, but we can compile it)
-        try:
-            compile(test_fstring, "<test>", "eval")
-        except SyntaxError as e:
-            pytest.fail(f"Dict in function call has syntax error: {e}")
+        assert result.returncode == 1
+        assert "error" in json.loads(out_path.read_text())
 
 
 class TestMetadataExtraction:
@@ -162,9 +134,181 @@ class TestMetadataExtraction:
         assert metadata.extracted_via == "pyproject.toml"
 
 
+class TestListDistInfos:
+    """Tests for in-process .dist-info listing."""
+
+    def test_lists_dist_info_directories(self, tmp_path):
+        """Test only .dist-info entries in the install directory are returned."""
+        from pyhc_actions.phep3.metadata_extractor import _list_dist_infos
+
+        (tmp_path / "my_pkg-1.0.dist-info").mkdir()
+        (tmp_path / "my_pkg").mkdir()
+
+        assert _list_dist_infos(tmp_path) == {"my_pkg-1.0.dist-info"}
+
+    def test_missing_directory(self, tmp_path):
+        """Test an empty set is returned when nothing was installed."""
+        from pyhc_actions.phep3.metadata_extractor import _list_dist_infos
+
+        assert _list_dist_infos(tmp_path / "site") == set()
+
+
+class TestSharedVenv:
+    """Tests for reusing one venv per Python version."""
+
+    def test_venv_created_once_per_python_version(self, tmp_path, monkeypatch):
+        """Test uv venv only runs the first time a version is requested."""
+        import subprocess
+        from pyhc_actions.phep3 import metadata_extractor
+
+        monkeypatch.setattr(metadata_extractor, "_SHARED_VENVS", {})
+        monkeypatch.setattr(metadata_extractor, "_shared_venv_root", tmp_path)
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, "", "")
+
+        monkeypatch.setattr(metadata_extractor.subprocess, "run", fake_run)
+
+        first = metadata_extractor._shared_venv("3.12")
+        assert metadata_extractor._shared_venv("3.12") == first
+        assert metadata_extractor._shared_venv("3.11") != first
+        assert [cmd[:2] for cmd in calls] == [["uv", "venv"], ["uv", "venv"]]
+
+    def test_failed_venv_is_not_remembered(self, tmp_path, monkeypatch):
+        """Test a failed venv creation is retried on the next call."""
+        import subprocess
+        from pyhc_actions.phep3 import metadata_extractor
+
+        monkeypatch.setattr(metadata_extractor, "_SHARED_VENVS", {})
+        monkeypatch.setattr(metadata_extractor, "_shared_venv_root", tmp_path)
+        returncodes = iter([1, 0])
+
+        def fake_run(cmd, **kwargs):
+            return subprocess.CompletedProcess(cmd, next(returncodes), "", "")
+
+        monkeypatch.setattr(metadata_extractor.subprocess, "run", fake_run)
+
+        assert metadata_extractor._shared_venv("3.12") is None
+        assert metadata_extractor._shared_venv("3.12") == tmp_path / "3.12"
+
+
+POETRY_PYPROJECT = """
+[tool.poetry]
+name = "legacy"
+version = "1.0.0"
+"""
+
+
+class TestMetadataCache:
+    """Tests for the on-disk uv metadata cache."""
+
+    @pytest.fixture(autouse=True)
+    def cache_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
+    @pytest.fixture
+    def project(self, tmp_path):
+        project = tmp_path / "project"
+        project.mkdir()
+        (project / "pyproject.toml").write_text(POETRY_PYPROJECT)
+        return project
+
+    @pytest.fixture
+    def cached_metadata(self, project):
+        from pyhc_actions.phep3.metadata_extractor import (
+            PackageMetadata,
+            _metadata_cache_file,
+            _write_cached_metadata,
+        )
+
+        metadata = PackageMetadata(
+            name="legacy",
+            requires_python=">=3.10",
+            dependencies=["numpy>=1.26"],
+            optional_dependencies={"test": ["pytest"]},
+            extracted_via="uv",
+        )
+        _write_cached_metadata(_metadata_cache_file(project, "3.12"), metadata)
+        return metadata
+
+    def test_cached_metadata_skips_uv(self, project, cached_metadata, monkeypatch):
+        """Test a cache hit is returned without building the project."""
+        from pyhc_actions.phep3 import metadata_extractor
+        from pyhc_actions.phep3.metadata_extractor import extract_metadata_with_uv
+
+        def fail_shared_venv(python_version):
+            raise AssertionError("uv should not build the project on a cache hit")
+
+        monkeypatch.setattr(metadata_extractor, "check_uv_available", lambda: True)
+        monkeypatch.setattr(metadata_extractor, "_shared_venv", fail_shared_venv)
+
+        assert extract_metadata_with_uv(project, "3.12", use_cache=True) == cached_metadata
+
+    def test_cache_is_off_by_default(self, project, cached_metadata, monkeypatch):
+        """Test the cache is only consulted when asked for."""
+        from pyhc_actions.phep3 import metadata_extractor
+        from pyhc_actions.phep3.metadata_extractor import extract_metadata_with_uv
+
+        monkeypatch.setattr(metadata_extractor, "check_uv_available", lambda: True)
+        monkeypatch.setattr(metadata_extractor, "_shared_venv", lambda python_version: None)
+
+        assert extract_metadata_with_uv(project, "3.12") is None
+
+    def test_cache_hit_still_requires_uv(self, project, cached_metadata, monkeypatch):
+        """Test a cached entry is not returned when uv is unavailable."""
+        from pyhc_actions.phep3 import metadata_extractor
+        from pyhc_actions.phep3.metadata_extractor import extract_metadata_with_uv
+
+        monkeypatch.setattr(metadata_extractor, "check_uv_available", lambda: False)
+
+        assert extract_metadata_with_uv(project, "3.12", use_cache=True) is None
+
+    def test_cache_key_tracks_packaging_files(self, project):
+        """Test the cache file changes with file contents and Python version."""
+        from pyhc_actions.phep3.metadata_extractor import _metadata_cache_file
+
+        first = _metadata_cache_file(project, "3.12")
+
+        assert first is not None
+        assert _metadata_cache_file(project, "3.12") == first
+        assert _metadata_cache_file(project, "3.11") != first
+
+        (project / "pyproject.toml").write_text(POETRY_PYPROJECT.replace("1.0.0", "1.0.1"))
+        assert _metadata_cache_file(project, "3.12") != first
+
+    @pytest.mark.parametrize(
+        "filename, content",
+        [
+            ("setup.py", "from setuptools import setup\nsetup()\n"),
+            ("pyproject.toml", '[project]\nname = "demo"\ndynamic = ["version"]\n'),
+            ("pyproject.toml", POETRY_PYPROJECT + "\n[tool.poetry-dynamic-versioning]\nenable = true\n"),
+            ("setup.cfg", "[metadata]\nname = demo\nversion = attr: demo.__version__\n"),
+            ("setup.cfg", "[options]\ninstall_requires = file: requirements.txt\n"),
+        ],
+    )
+    def test_dynamic_metadata_is_not_cached(self, tmp_path, filename, content):
+        """Test projects whose metadata can come from other files get no cache key."""
+        from pyhc_actions.phep3.metadata_extractor import _metadata_cache_file
+
+        (tmp_path / filename).write_text(content)
+        assert _metadata_cache_file(tmp_path, "3.12") is None
+
+    def test_project_without_packaging_files_is_not_cached(self, tmp_path):
+        """Test an empty directory does not share a Python-version-only key."""
+        from pyhc_actions.phep3.metadata_extractor import _metadata_cache_file
+
+        assert _metadata_cache_file(tmp_path, "3.12") is None
+
+
 class TestExtractMetadataFromProject:
     """Tests for extract_metadata_from_project function."""
 
+    @pytest.fixture(autouse=True)
+    def cache_home(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+
     def test_extract_from_pyproject_toml(self):
         """Test extracting metadata from a PEP 621 pyproject.toml."""
         from pyhc_actions.phep3.metadata_extractor import extract_metadata_from_project
@@ -1,11 +1,18 @@
 """Tests for common parser utilities."""
 
+import os
+import tomllib
+
 import pytest
 from packaging.specifiers import SpecifierSet
 from packaging.version import Version
 
 from pyhc_actions.common.parser import (
+    clear_pyproject_cache,
     parse_dependency,
+    parse_pyproject,
+    parse_pyproject_project_section,
+    release_tuple,
     extract_version_bounds,
     extract_python_version,
     extract_python_bounds,
@@ -73,6 +80,16 @@ class TestParseDependency:
         dep = parse_dependency("numpy")
         assert dep is not None
 
+    def test_precomputed_name_forms(self):
+        """Test lowercase and normalized names are set on parse."""
+        dep = parse_dependency("Scikit_Image.Extra>=0.22")
+        assert dep.name_lower == "scikit_image.extra"
+        assert dep.pep503_name == "scikit-image-extra"
+
+    def test_results_are_memoized(self):
+        """Test that identical strings reuse the parsed dependency."""
+        assert parse_dependency("numpy>=1.26") is parse_dependency("numpy>=1.26")
+
 
 class TestExtractVersionBounds:
     """Tests for extract_version_bounds function."""
@@ -121,6 +138,30 @@ class TestExtractVersionBounds:
         assert bounds.exact is None
 
 
+class TestReleaseTuple:
+    """Tests for release_tuple function."""
+
+    def test_plain_releases_are_padded(self):
+        """Test plain releases map to padded (major, minor, micro) tuples."""
+        assert release_tuple(Version("1.26")) == (1, 26, 0)
+        assert release_tuple(Version("2")) == (2, 0, 0)
+        assert release_tuple(Version("1.26.4")) == (1, 26, 4)
+
+    def test_non_plain_releases_return_none(self):
+        """Test versions that tuples can't order correctly return None."""
+        assert release_tuple(Version("2.0rc1")) is None
+        assert release_tuple(Version("1.0.post1")) is None
+        assert release_tuple(Version("1.0+local")) is None
+        assert release_tuple(Version("1!2.0")) is None
+        assert release_tuple(Version("1.2.3.4")) is None
+
+    def test_bounds_expose_release_tuples(self):
+        """Test VersionBounds caches release tuples of its bounds."""
+        bounds = extract_version_bounds(SpecifierSet(">=1.26,<2.0rc1"))
+        assert bounds.lower_release == (1, 26, 0)
+        assert bounds.upper_release is None
+
+
 class TestExtractPythonVersion:
     """Tests for extract_python_version function."""
 
@@ -261,3 +302,73 @@ class TestExtractPythonBounds:
         assert bounds.lower == Version("3.9")
         assert len(bounds.exclusions) == 1
         assert Version("3.11") in bounds.exclusions
+
+
+class TestParsePyprojectCache:
+    """Tests for parse_pyproject caching."""
+
+    def test_unchanged_file_is_reused(self, tmp_path, monkeypatch):
+        """Test repeated parses of an unchanged file reuse the cached parse."""
+        path = tmp_path / "pyproject.toml"
+        path.write_text('[project]\nname = "demo"\n')
+        clear_pyproject_cache()
+
+        loads = []
+        real_loads = tomllib.loads
+        monkeypatch.setattr(tomllib, "loads", lambda text: loads.append(text) or real_loads(text))
+
+        assert parse_pyproject(path) == parse_pyproject(path)
+        assert len(loads) == 1
+
+        clear_pyproject_cache()
+        parse_pyproject(path)
+        assert len(loads) == 2
+
+    def test_callers_get_independent_copies(self, tmp_path):
+        """Test mutating one result does not leak into the next call."""
+        path = tmp_path / "pyproject.toml"
+        path.write_text('[project]\nname = "demo"\ndependencies = ["numpy"]\n')
+
+        parse_pyproject(path)["project"]["dependencies"].append("scipy")
+        parse_pyproject_project_section(path)["dependencies"].append("scipy")
+
+        assert parse_pyproject(path)["project"]["dependencies"] == ["numpy"]
+        assert parse_pyproject_project_section(path)["dependencies"] == ["numpy"]
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        """Test a changed file is parsed again."""
+        path = tmp_path / "pyproject.toml"
+        path.write_text('[project]\nname = "demo"\n')
+        assert parse_pyproject(path)["project"]["name"] == "demo"
+
+        path.write_text('[project]\nname = "demo-renamed"\n')
+        assert parse_pyproject(path)["project"]["name"] == "demo-renamed"
+
+    def test_same_size_rewrite_with_same_mtime_is_reparsed(self, tmp_path):
+        """Test a rewrite is noticed even when size and mtime are unchanged."""
+        path = tmp_path / "pyproject.toml"
+        path.write_text('[project]\nname = "demo-a"\n')
+        stamp = path.stat().st_mtime_ns
+        assert parse_pyproject(path)["project"]["name"] == "demo-a"
+
+        path.write_text('[project]\nname = "demo-b"\n')
+        os.utime(path, ns=(stamp, stamp))
+        assert parse_pyproject(path)["project"]["name"] == "demo-b"
+
+    def test_project_section_only(self, tmp_path):
+        """Test only the [project] table is returned."""
+        path = tmp_path / "pyproject.toml"
+        path.write_text(
+            '[project]\nname = "demo"\ndependencies = ["numpy>=1.26"]\n'
+            "[tool.ruff]\nline-length = 100\n"
+        )
+
+        project = parse_pyproject_project_section(path)
+        assert project == {"name": "demo", "dependencies": ["numpy>=1.26"]}
+
+    def test_project_section_missing(self, tmp_path):
+        """Test a file without [project] gives an empty dict."""
+        path = tmp_path / "pyproject.toml"
+        path.write_text("[tool.poetry]\nname = \"demo\"\n")
+
+        assert parse_pyproject_project_section(path) == {}
@@ -1,15 +1,21 @@
 """Tests for PHEP 3 compliance checker."""
 
 import json
+import os
 import pytest
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 import tempfile
 
 from pyhc_actions.common.reporter import Reporter
-from pyhc_actions.phep3.checker import check_compliance, check_pyproject
+from pyhc_actions.phep3.checker import _load_schedule, check_compliance, check_pyproject
 from pyhc_actions.phep3.schedule import Schedule, VersionSchedule
-from pyhc_actions.phep3.config import is_core_package, normalize_package_name
+from pyhc_actions.phep3.config import (
+    CORE_PACKAGES,
+    fast_package_name,
+    is_core_package,
+    normalize_package_name,
+)
 from pyhc_actions.phep3 import main as phep3_main
 
 
@@ -38,6 +44,15 @@ class TestCorePackageDetection:
         assert normalize_package_name("Scikit-Image") == "scikit-image"
         assert normalize_package_name("scikit_image") == "scikit-image"
 
+    def test_fast_package_name(self):
+        """Test cheap name extraction from dependency strings."""
+        assert fast_package_name("numpy>=1.26") == "numpy"
+        assert fast_package_name("Scikit_Image[data] ~= 0.22") == "scikit-image"
+        assert fast_package_name("scipy; python_version < '3.12'") == "scipy"
+        assert fast_package_name("pandas (>=2.0)") == "pandas"
+        assert fast_package_name("xarray @ https://example.com/x.whl") == "xarray"
+        assert fast_package_name("  matplotlib  ") == "matplotlib"
+
 
 class TestSchedule:
     """Tests for Schedule class."""
@@ -69,6 +84,52 @@ class TestSchedule:
         assert "numpy" in schedule.packages
         assert "1.26" in schedule.packages["numpy"]
 
+    def test_prime_caches_fills_lookups(self):
+        """Test priming parses every schedule version up front."""
+        now = datetime.now(timezone.utc)
+        sched = VersionSchedule(
+            version="2.0", release_date=now, drop_date=now, support_by=now
+        )
+        schedule = Schedule(
+            generated_at=now,
+            python={"3.12": VersionSchedule("3.12", now, now, now)},
+            packages={"NumPy": {"2.0": sched}},
+        )
+
+        schedule.prime_caches()
+
+        assert set(schedule._release_tuples) == {"3.12", "2.0"}
+        assert "normalized_package_index" in schedule.__dict__
+
+    def test_malformed_version_key_does_not_break_loading(self):
+        """Test a bad version key loads and is never chosen as the minimum."""
+        entry = {
+            "release_date": "2023-10-02T00:00:00+00:00",
+            "drop_date": "2099-10-02T00:00:00+00:00",
+            "support_by": "2024-04-02T00:00:00+00:00",
+        }
+        schedule = Schedule.from_dict({
+            "generated_at": "2024-01-01T00:00:00+00:00",
+            "python": {"not-a-version": entry, "3.12": entry},
+            "packages": {},
+        })
+
+        assert schedule.get_minimum_python_version() == "3.12"
+
+    def test_version_schedule_from_dict_is_utc(self):
+        """Test timestamps with or without an offset are read as UTC."""
+        sched = VersionSchedule.from_dict(
+            "3.12",
+            {
+                "release_date": "2023-10-02T00:00:00+00:00",
+                "drop_date": "2026-10-02T00:00:00",
+                "support_by": "2024-04-02T00:00:00+00:00",
+            },
+        )
+        assert sched.release_date == datetime(2023, 10, 2, tzinfo=timezone.utc)
+        assert sched.drop_date == datetime(2026, 10, 2, tzinfo=timezone.utc)
+        assert sched.drop_date.tzinfo is timezone.utc
+
     def test_version_is_droppable(self):
         """Test version droppability check."""
         release_date = datetime(2020, 1, 1, tzinfo=timezone.utc)
@@ -90,6 +151,59 @@ class TestSchedule:
         now = datetime(2022, 1, 1, tzinfo=timezone.utc)
         assert vs.is_droppable(now) is False
 
+    def test_normalized_package_index(self):
+        """Test schedule package names are indexed by normalized name."""
+        schedule = Schedule(
+            generated_at=datetime.now(timezone.utc),
+            python={},
+            packages={"scikit_image": {}, "NumPy": {}},
+        )
+
+        index = schedule.normalized_package_index
+        assert index == {"scikit-image": "scikit_image", "numpy": "NumPy"}
+        assert schedule.normalized_package_index is index
+
+
+class TestLoadSchedule:
+    """Tests for the cached schedule loader."""
+
+    @staticmethod
+    def write_schedule(path, numpy_version):
+        release = "2024-01-01T00:00:00+00:00"
+        path.write_text(json.dumps({
+            "generated_at": release,
+            "python": {},
+            "packages": {
+                "numpy": {
+                    numpy_version: {
+                        "release_date": release,
+                        "drop_date": release,
+                        "support_by": release,
+                    }
+                }
+            },
+        }))
+
+    def test_same_size_rewrite_with_same_mtime_is_reloaded(self, tmp_path):
+        """Test a rewrite is noticed even when size and mtime are unchanged."""
+        path = tmp_path / "schedule.json"
+        self.write_schedule(path, "1.25")
+        stamp = path.stat().st_mtime_ns
+        assert list(_load_schedule(path).packages["numpy"]) == ["1.25"]
+
+        self.write_schedule(path, "1.26")
+        os.utime(path, ns=(stamp, stamp))
+        assert list(_load_schedule(path).packages["numpy"]) == ["1.26"]
+
+    def test_callers_get_independent_copies(self, tmp_path):
+        """Test mutating one loaded schedule does not affect the next."""
+        path = tmp_path / "schedule.json"
+        self.write_schedule(path, "1.25")
+
+        _load_schedule(path).packages.clear()
+
+        assert list(_load_schedule(path).packages["numpy"]) == ["1.25"]
+
 
 class TestCompliance:
     """Tests for compliance checking."""
@@ -168,6 +282,33 @@ dependencies = [
             assert passed is True
             assert not reporter.has_errors
 
+    def test_required_versions_scanned_once_per_check(self, schedule, monkeypatch, tmp_path):
+        """Test must-be-supported versions are shared within, not across, checks."""
+        path = tmp_path / "pyproject.toml"
+        path.write_text(
+            "[project]\n"
+            'name = "test-package"\n'
+            'requires-python = ">=3.10"\n'
+            'dependencies = ["numpy>=1.25,<3"]\n'
+            "[project.optional-dependencies]\n"
+            'dev = ["numpy>=1.25,<2.5"]\n'
+        )
+        calls = []
+        original = schedule.must_be_supported_versions
+
+        def counting(package, now):
+            calls.append((package, now))
+            return original(package, now)
+
+        monkeypatch.setattr(schedule, "must_be_supported_versions", counting)
+
+        now = datetime.now(timezone.utc)
+        check_compliance(path, schedule, Reporter(), now=now, use_uv_fallback=False)
+        assert calls == [("numpy", now)]
+
+        check_compliance(path, schedule, Reporter(), now=now, use_uv_fallback=False)
+        assert len(calls) == 2
+
     def test_old_python_version(self, schedule):
         """Test checking pyproject with old Python version."""
         content = """
@@ -319,7 +460,7 @@ dependencies = [
         """Test uv metadata extraction note format."""
         from pyhc_actions.phep3.metadata_extractor import PackageMetadata
 
-        def fake_extract_metadata_from_project(project_dir, schedule):
+        def fake_extract_metadata_from_project(project_dir, schedule, use_cache=False):
             return PackageMetadata(
                 name="legacy-package",
                 requires_python=">=3.10",
@@ -347,7 +488,7 @@ dependencies = [
         """Test uv fallback notes don't contribute to warning counts."""
         from pyhc_actions.phep3.metadata_extractor import PackageMetadata
 
-        def fake_extract_metadata_from_project(project_dir, schedule):
+        def fake_extract_metadata_from_project(project_dir, schedule, use_cache=False):
             return PackageMetadata(
                 name="legacy-package",
                 requires_python=">=3.10",
@@ -901,6 +1042,16 @@ class TestScheduleHelpers:
         assert "1.25" in non_droppable
         assert "2.0" in non_droppable
 
+    def test_must_be_supported_versions(self, schedule):
+        """Test must_be_supported_versions pairs versions with parsed Versions."""
+        from packaging.version import Version
+
+        now = datetime.now(timezone.utc)
+        required = schedule.must_be_supported_versions("numpy", now)
+
+        assert required == [("1.25", Version("1.25")), ("2.0", Version("2.0"))]
+        assert schedule.must_be_supported_versions("scipy", now) == []
+
 
 class TestExtrasHandling:
     """Tests for optional dependencies (extras) handling."""
@@ -1048,6 +1199,32 @@ image = ["numpy<1.26"]
             assert "dev" in contexts
             assert "image" in contexts
 
+    def test_same_requirement_in_several_extras_reported_once(self, schedule):
+        """Test a requirement repeated across extras is reported once with all groups."""
+        content = """
+[project]
+name = "test-package"
+version = "1.0.0"
+requires-python = ">=3.10"
+dependencies = []
+
+[project.optional-dependencies]
+test = ["numpy<1.26"]
+docs = ["numpy<1.26"]
+"""
+        with tempfile.NamedTemporaryFile(mode="w", suffix=".toml", delete=False) as f:
+            f.write(content)
+            f.flush()
+
+            reporter = Reporter()
+            check_compliance(f.name, schedule, reporter, use_uv_fallback=False)
+
+            upper_warnings = [
+                w for w in reporter.warnings if "upper bound constraint" in w.message
+            ]
+            assert len(upper_warnings) == 1
+            assert upper_warnings[0].context == "test, docs"
+
     def test_base_error_with_extras_warning(self, schedule):
         """Test that base errors fail even if extras only have warnings."""
         content = """
@@ -1427,7 +1604,9 @@ dependencies = ["numpy>=2.0"]
             captured_kwargs.update(kwargs)
             return True, Reporter()
 
-        monkeypatch.setattr(phep3_main, "check_pyproject", fake_check_pyproject)
+        monkeypatch.setattr(
+            "pyhc_actions.phep3.checker.check_pyproject", fake_check_pyproject
+        )
 
         exit_code = phep3_main.main([
             str(pyproject),
@@ -1456,7 +1635,9 @@ dependencies = []
             captured_kwargs.update(kwargs)
             return True, Reporter()
 
-        monkeypatch.setattr(phep3_main, "check_pyproject", fake_check_pyproject)
+        monkeypatch.setattr(
+            "pyhc_actions.phep3.checker.check_pyproject", fake_check_pyproject
+        )
 
         exit_code = phep3_main.main([
             str(pyproject),
@@ -1485,7 +1666,9 @@ dependencies = []
             captured_kwargs.update(kwargs)
             return True, Reporter()
 
-        monkeypatch.setattr(phep3_main, "check_pyproject", fake_check_pyproject)
+        monkeypatch.setattr(
+            "pyhc_actions.phep3.checker.check_pyproject", fake_check_pyproject
+        )
 
         exit_code = phep3_main.main([
             str(pyproject),
@@ -1514,7 +1697,9 @@ dependencies = []
             captured_kwargs.update(kwargs)
             return True, Reporter()
 
-        monkeypatch.setattr(phep3_main, "check_pyproject", fake_check_pyproject)
+        monkeypatch.setattr(
+            "pyhc_actions.phep3.checker.check_pyproject", fake_check_pyproject
+        )
 
         exit_code = phep3_main.main([
             str(pyproject),
@@ -1542,7 +1727,9 @@ dependencies = []
             captured_kwargs.update(kwargs)
             return True, Reporter()
 
-        monkeypatch.setattr(phep3_main, "check_pyproject", fake_check_pyproject)
+        monkeypatch.setattr(
+            "pyhc_actions.phep3.checker.check_pyproject", fake_check_pyproject
+        )
 
         exit_code = phep3_main.main([
             str(pyproject),
@@ -1554,3 +1741,265 @@ dependencies = []
         assert exit_code == 0
         assert "ignore_errors_for" in captured_kwargs
         assert captured_kwargs["ignore_errors_for"] == {"numpy", "xarray"}
+
+
+class TestMultipleProjectsCLI:
+    """Tests for checking several project files in one CLI call."""
+
+    def test_cli_checks_each_project_in_order(self, tmp_path, monkeypatch, capsys):
+        """Test every project is checked and reported in argument order."""
+        paths = []
+        for name in ("alpha", "beta", "gamma"):
+            project_dir = tmp_path / name
+            project_dir.mkdir()
+            pyproject = project_dir / "pyproject.toml"
+            pyproject.write_text(f"""
+[project]
+name = "{name}"
+version = "1.0.0"
+requires-python = ">=3.10"
+dependencies = []
+""")
+            paths.append(pyproject)
+
+        checked = []
+
+        def fake_check_pyproject(**kwargs):
+            checked.append(kwargs["pyproject_path"])
+            reporter = Reporter(title="PHEP 3 Compliance Check")
+            if kwargs["pyproject_path"].parent.name == "beta":
+                reporter.add_error(package="numpy", message="broken")
+            return not reporter.has_errors, reporter
+
+        monkeypatch.setattr(
+            "pyhc_actions.phep3.checker.check_pyproject", fake_check_pyproject
+        )
+
+        exit_code = phep3_main.main([str(p) for p in paths] + ["--no-uv-fallback"])
+
+        assert exit_code == 1
+        assert sorted(checked) == sorted(paths)
+        out = capsys.readouterr().out
+        titles = [f"PHEP 3 Compliance Check: {p}" for p in paths]
+        positions = [out.index(title) for title in titles]
+        assert positions == sorted(positions)
+
+    def test_cli_fails_if_any_project_missing(self, tmp_path, monkeypatch):
+        """Test a missing project file fails before anything is checked."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "demo"\n')
+
+        def fake_check_pyproject(**kwargs):
+            raise AssertionError("no project should be checked")
+
+        monkeypatch.setattr(
+            "pyhc_actions.phep3.checker.check_pyproject", fake_check_pyproject
+        )
+
+        exit_code = phep3_main.main([
+            str(pyproject),
+            str(tmp_path / "missing" / "pyproject.toml"),
+            "--no-uv-fallback",
+        ])
+
+        assert exit_code == 1
+
+    @pytest.mark.parametrize("flag, expected", [([], False), (["--metadata-cache"], True)])
+    def test_cli_metadata_cache_is_opt_in(self, tmp_path, monkeypatch, flag, expected):
+        """Test the on-disk metadata cache is only used with --metadata-cache."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text('[project]\nname = "demo"\n')
+        captured_kwargs = {}
+
+        def fake_check_pyproject(**kwargs):
+            captured_kwargs.update(kwargs)
+            return True, Reporter()
+
+        monkeypatch.setattr(
+            "pyhc_actions.phep3.checker.check_pyproject", fake_check_pyproject
+        )
+
+        assert phep3_main.main([str(pyproject), "--no-uv-fallback", *flag]) == 0
+        assert captured_kwargs["use_metadata_cache"] is expected
+
+    def test_cli_notes_printed_with_their_project(self, tmp_path, monkeypatch, capsys):
+        """Test each project's notes are printed with its own report."""
+        paths = []
+        for name in ("alpha", "beta"):
+            project_dir = tmp_path / name
+            project_dir.mkdir()
+            pyproject = project_dir / "pyproject.toml"
+            pyproject.write_text(f'[project]\nname = "{name}"\n')
+            paths.append(pyproject)
+
+        def fake_check_pyproject(**kwargs):
+            reporter = Reporter(title="PHEP 3 Compliance Check", output=kwargs["output"])
+            reporter.print(f"Note: checking {kwargs['pyproject_path'].parent.name}")
+            return True, reporter
+
+        monkeypatch.setattr(
+            "pyhc_actions.phep3.checker.check_pyproject", fake_check_pyproject
+        )
+
+        assert phep3_main.main([str(p) for p in paths] + ["--no-uv-fallback"]) == 0
+
+        out = capsys.readouterr().out
+        markers = [
+            "Note: checking alpha",
+            f"PHEP 3 Compliance Check: {paths[0]}",
+            "Note: checking beta",
+            f"PHEP 3 Compliance Check: {paths[1]}",
+        ]
+        positions = [out.index(marker) for marker in markers]
+        assert positions == sorted(positions)
+
+
+class TestFetchPackageReleases:
+    """Tests for building package schedules from PyPI file listings."""
+
+    class FakeResponse:
+        """Minimal stand-in for requests.Response."""
+
+        def __init__(self, files=None, status_code=200, headers=None):
+            self.files = files
+            self.status_code = status_code
+            self.headers = headers or {}
+
+        def raise_for_status(self):
+            pass
+
+        @property
+        def content(self):
+            return json.dumps({"meta": {"api-version": "1.1"}, "files": self.files}).encode()
+
+    @pytest.fixture
+    def fetcher(self, tmp_path, monkeypatch):
+        """Isolate pypi_fetcher's caches from the user's cache and other tests."""
+        from pyhc_actions.phep3 import pypi_fetcher
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        monkeypatch.setattr(pypi_fetcher, "_RELEASES_CACHE", {})
+        return pypi_fetcher
+
+    @pytest.fixture
+    def pypi_files(self, fetcher, monkeypatch):
+        """Serve a canned PyPI simple-API response for fetch_package_releases."""
+        year = datetime.now(timezone.utc).year
+        files = [
+            {"filename": "numpy-2.0.0.tar.gz", "upload-time": f"{year}-01-02T03:04:05.678901Z"},
+            {"filename": "numpy-2.0.0-cp312-cp312-manylinux.whl", "upload-time": f"{year}-01-01T00:00:00Z"},
+            {"filename": "numpy-2.0.1.tar.gz", "upload-time": f"{year}-02-01T00:00:00Z"},
+            {"filename": "numpy-2.1.0rc1.tar.gz", "upload-time": f"{year}-03-01T00:00:00Z"},
+            {"filename": "numpy-2.1.0.tar.gz", "upload-time": "not a date"},
+            {"filename": "README"},
+        ]
+        self.use_session(fetcher, monkeypatch, lambda *args, **kwargs: self.FakeResponse(files))
+        return year
+
+    @staticmethod
+    def use_session(fetcher, monkeypatch, get):
+        """Route the fetcher's shared session to a fake get function."""
+
+        class FakeSession:
+            pass
+
+        session = FakeSession()
+        session.get = get
+        monkeypatch.setattr(fetcher, "_shared_session", lambda: session)
+
+    def test_uses_earliest_upload_of_each_minor_release(self, pypi_files):
+        """Test upload times are parsed and the earliest file wins."""
+        from pyhc_actions.phep3.pypi_fetcher import fetch_package_releases
+
+        releases = fetch_package_releases("numpy")
+
+        assert list(releases) == ["2.0"]
+        assert releases["2.0"].release_date == datetime(pypi_files, 1, 1, tzinfo=timezone.utc)
+
+    def test_release_filenames_with_separators_in_name(self, fetcher):
+        """Test names with '-' or '_' separators and the X.Y.0 filter."""
+        pattern = fetcher._release_filename_re("scikit-image")
+
+        assert pattern.match("scikit_image-0.24.0-cp312-cp312-win_amd64.whl").group(1) == "0.24.0"
+        assert pattern.match("scikit-image-0.19.0.tar.gz").group(1) == "0.19.0"
+        assert pattern.match("scikit-image-0.19.3.tar.gz") is None
+        assert pattern.match("scikit_image-0.25.0rc1.tar.gz") is None
+        assert pattern.match("scikit_image-0.25.0.dev0.tar.gz") is None
+        assert pattern.match("scikit_learn-1.5.0.tar.gz") is None
+
+    def test_conditional_get_reuses_cached_response(self, fetcher, monkeypatch):
+        """Test a 304 answer is served from the on-disk response cache."""
+        year = datetime.now(timezone.utc).year
+        files = [{
+            "filename": "scipy-1.14.0.tar.gz",
+            "upload-time": f"{year}-01-01T00:00:00Z",
+            "hashes": {"sha256": "0" * 64},
+        }]
+        sent_headers = []
+
+        def fake_get(url, headers, timeout):
+            sent_headers.append(headers)
+            if headers.get("If-None-Match") == '"v1"':
+                return self.FakeResponse(status_code=304)
+            return self.FakeResponse(files, headers={"ETag": '"v1"'})
+
+        self.use_session(fetcher, monkeypatch, fake_get)
+
+        first = fetcher.fetch_package_releases("scipy")
+        assert fetcher.fetch_package_releases("scipy") == first
+        assert len(sent_headers) == 1  # second call memoized in-process
+
+        fetcher._RELEASES_CACHE.clear()
+        assert fetcher.fetch_package_releases("scipy") == first
+        assert "If-None-Match" not in sent_headers[0]
+        assert sent_headers[1]["If-None-Match"] == '"v1"'
+
+        # Only the fields the fetcher reads are kept in the cache
+        cached = json.loads(fetcher._http_cache_file("scipy").read_text())
+        assert cached["body"]["files"] == [
+            {"filename": "scipy-1.14.0.tar.gz", "upload-time": f"{year}-01-01T00:00:00Z"}
+        ]
+
+    def test_caller_session_is_sent_json_accept_header(self, fetcher):
+        """Test a caller-supplied session still asks PyPI for the JSON API."""
+        year = datetime.now(timezone.utc).year
+        files = [{"filename": "numpy-2.0.0.tar.gz", "upload-time": f"{year}-01-01T00:00:00Z"}]
+        sent_headers = []
+
+        class FakeSession:
+            def get(self, url, headers, timeout):
+                sent_headers.append(headers)
+                return TestFetchPackageReleases.FakeResponse(files)
+
+        releases = fetcher.fetch_package_releases("numpy", session=FakeSession())
+
+        assert list(releases) == ["2.0"]
+        assert sent_headers[0]["Accept"] == "application/vnd.pypi.simple.v1+json"
+
+    def test_fetch_all_core_packages_shares_one_session(self, fetcher, monkeypatch):
+        """Test every core package is fetched over the same session."""
+        sessions = set()
+
+        def fake_fetch(package, session=None):
+            sessions.add(id(session))
+            return {"1.0": package}
+
+        monkeypatch.setattr(fetcher, "fetch_package_releases", fake_fetch)
+
+        packages = fetcher.fetch_all_core_packages()
+
+        assert list(packages) == sorted(CORE_PACKAGES)
+        assert all(packages[p] == {"1.0": p} for p in CORE_PACKAGES)
+        assert len(sessions) == 1 and id(None) not in sessions
+
+    def test_shared_session_retries_gateway_errors(self, fetcher, monkeypatch):
+        """Test the shared session mounts a retrying adapter for PyPI."""
+        monkeypatch.setattr(fetcher, "_session", None)
+
+        session = fetcher._shared_session()
+        retries = session.get_adapter(fetcher.PYPI_SIMPLE_URL).max_retries
+
+        assert fetcher._shared_session() is session
+        assert retries.total == 3
+        assert 503 in retries.status_forcelist
+        assert session.headers["Accept"] == "application/vnd.pypi.simple.v1+json"
@@ -0,0 +1,63 @@
+"""Tests for the fast requires-python matcher."""
+
+import pytest
+from packaging.specifiers import SpecifierSet
+from packaging.version import Version
+
+from pyhc_actions.env_compat.version_fast import (
+    contains_fast,
+    parse_release,
+    parse_specifier,
+)
+
+SPECIFIERS = [
+    "",
+    ">=3.11",
+    ">=3.11,<3.14",
+    " >= 3.9 , < 4 ",
+    ">3.12",
+    "<=3.12",
+    "<3.12",
+    "==3.12",
+    "==3.12.*",
+    "!=3.12.*",
+    "!=3.12.0",
+    "~=3.11",
+    "~=3.12.1",
+    ">=3.8,!=3.9.*,<3.13",
+    ">=3.11,",
+]
+
+VERSIONS = ["3.8", "3.9.7", "3.11", "3.11.4", "3.12", "3.12.0", "3.12.1", "3.12.9", "3.13.1", "4.0"]
+
+
+class TestParse:
+    """Tests for parse_release and parse_specifier."""
+
+    def test_parse_release(self):
+        assert parse_release("3.12.9") == (3, 12, 9)
+        assert parse_release(" 3.12 ") == (3, 12)
+
+    @pytest.mark.parametrize("version", ["3.12rc1", "1!3.12", "3.12+local", "v3.12", "3..12", "", "３.12"])
+    def test_parse_release_rejects_non_release(self, version):
+        assert parse_release(version) is None
+
+    def test_parse_specifier(self):
+        assert parse_specifier(">=3.11, <3.14") == [(">=", (3, 11), False), ("<", (3, 14), False)]
+        assert parse_specifier("==3.12.*") == [("==", (3, 12), True)]
+
+    @pytest.mark.parametrize(
+        "specifier", ["===3.12", ">=3.12rc1", "~=3", ">=3.12.*", "3.12", "=>3.12", ">= = 3"]
+    )
+    def test_parse_specifier_rejects_unsupported(self, specifier):
+        assert parse_specifier(specifier) is None
+
+
+class TestContainsFast:
+    """contains_fast must agree with packaging for every supported input."""
+
+    @pytest.mark.parametrize("specifier", SPECIFIERS)
+    @pytest.mark.parametrize("version", VERSIONS)
+    def test_matches_packaging(self, specifier, version):
+        expected = Version(version) in SpecifierSet(specifier)
+        assert contains_fast(parse_specifier(specifier), parse_release(version)) is expected